@@ -1,9 +1,11 @@
 """Pytest configuration and fixtures for FIRS E-Invoice tests."""
 
+import asyncio
 import pytest
 from datetime import datetime, date
 from decimal import Decimal
 from typing import Dict, Any
+from unittest.mock import Mock, patch
 
 from zutax import (
     ZutaxClient as FIRSClient,
@@ -25,6 +27,54 @@ from zutax.models.enums import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _restore_shared_api_client(monkeypatch):
+    """Undo a shared API client created by ZutaxAPIClient.instance() in a test."""
+    import zutax.api.client as api_module
+
+    monkeypatch.setattr(api_module, "api_client", api_module.api_client)
+
+
+@pytest.fixture
+def mock_api(request):
+    """Patch the shared API client with awaitable fakes that count calls.
+
+    Parametrize indirectly with a function mapping a GET endpoint to its
+    response data; unparametrized GETs fail with HTTP 404. POSTs always
+    fail with HTTP 400. Yields the active/peak/count GET counters.
+    """
+    from zutax.api.client import APIResponse
+
+    respond = getattr(request, "param", None)
+    calls = {"active": 0, "peak": 0, "count": 0}
+
+    async def aget(endpoint, params=None, **kwargs):
+        calls["active"] += 1
+        calls["peak"] = max(calls["peak"], calls["active"])
+        await asyncio.sleep(0.01)
+        calls["active"] -= 1
+        calls["count"] += 1
+        if respond is None:
+            return APIResponse(success=False, error="HTTP 404")
+        return APIResponse(success=True, data=respond(endpoint))
+
+    async def apost(endpoint, data=None, json=None, **kwargs):
+        return APIResponse(success=False, error="HTTP 400")
+
+    fake = Mock()
+    fake.aget = aget
+    fake.apost = apost
+    with patch("zutax.api.client.api_client", fake):
+        yield calls
+
+
+@pytest.fixture(scope="session")
+def rsa_key():
+    """Provide a throwaway RSA key pair shared by the crypto tests."""
+    RSA = pytest.importorskip("Crypto.PublicKey.RSA")
+    return RSA.generate(2048)
+
+
 @pytest.fixture
 def test_config():
     """Provide test configuration."""
@@ -0,0 +1,225 @@
+"""Tests for the Zutax API client."""
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+import requests
+from unittest.mock import Mock, patch
+
+from zutax.api.client import TokenBucket, ZutaxAPIClient
+
+
+@pytest.fixture
+def api(test_config):
+    """Provide an API client with a mocked session transport."""
+    client = ZutaxAPIClient(config=test_config)
+    client.session.request = Mock()
+    return client
+
+
+def _response(status_code=200, payload=None):
+    response = Mock()
+    response.status_code = status_code
+    response.content = json.dumps(payload).encode() if payload is not None else b""
+    response.json.side_effect = AssertionError("body should not be re-parsed")
+    return response
+
+
+class TestZutaxAPIClient:
+    """Test API client request handling."""
+
+    def test_session_retry_adapter(self, api, test_config):
+        """Test the mounted adapter uses config retries and pool sizing."""
+        adapter = api.session.get_adapter("https://api-sandbox.firs.gov.ng")
+        assert adapter.max_retries.total == test_config.max_retries
+        assert 503 in adapter.max_retries.status_forcelist
+        assert "POST" in adapter.max_retries.allowed_methods
+        assert adapter._pool_maxsize == ZutaxAPIClient.POOL_MAXSIZE
+
+    def test_get_success(self, api):
+        """Test GET builds the full URL and wraps the JSON body."""
+        api.session.request.return_value = _response(200, {"ok": True})
+
+        result = api.get("/api/v1/invoice/status/IRN-1", params={"a": 1})
+
+        assert result.success is True
+        assert result.data == {"ok": True}
+        method, url = api.session.request.call_args.args
+        assert method == "GET"
+        assert url == "https://api-sandbox.firs.gov.ng/api/v1/invoice/status/IRN-1"
+        assert api.session.request.call_args.kwargs["params"] == {"a": 1}
+
+    def test_post_error(self, api):
+        """Test HTTP errors are converted to a failed APIResponse."""
+        api.session.request.return_value = _response(
+            400, {"message": "Invalid invoice data"}
+        )
+
+        result = api.post("/api/v1/invoice/submit", json={"x": 1})
+
+        assert result.success is False
+        assert result.status_code == 400
+        assert result.error == "HTTP 400"
+        assert result.message == "Invalid invoice data"
+
+    def test_error_non_json_body(self, api):
+        """Test error responses with a non-JSON body fall back to the status."""
+        response = _response(502)
+        response.content = b"<html>Bad Gateway</html>"
+        api.session.request.return_value = response
+
+        result = api.get("/api/v1/ping")
+
+        assert result.success is False
+        assert result.message == "HTTP 502 error"
+
+    def test_delete_empty_body(self, api):
+        """Test responses without content yield no data."""
+        api.session.request.return_value = _response(204)
+
+        result = api.delete("/api/v1/invoice/IRN-1")
+
+        assert result.success is True
+        assert result.data is None
+
+    def test_request_debug_logging(self, api, caplog):
+        """Test requests are logged only when DEBUG is enabled."""
+        api.session.request.return_value = _response(200, {})
+
+        with caplog.at_level("INFO", logger="zutax.api.client"):
+            api.get("/api/v1/ping")
+        assert caplog.records == []
+
+        with caplog.at_level("DEBUG", logger="zutax.api.client"):
+            api.get("/api/v1/ping")
+        assert "GET https://api-sandbox.firs.gov.ng/api/v1/ping -> 200" in caplog.text
+
+    def test_close_releases_session(self, test_config):
+        """Test the context manager closes the pooled session."""
+        with ZutaxAPIClient(config=test_config) as client:
+            client.session.close = Mock()
+        client.session.close.assert_called_once_with()
+
+
+class TestTokenBucket:
+    """Test the async request rate limiter."""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_throttle(self):
+        """Test calls beyond the burst wait for the bucket to refill."""
+        bucket = TokenBucket(rate_per_minute=6000, burst=2)  # 100/s
+
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(4)))
+        elapsed = time.monotonic() - start
+
+        # Two immediate, then two more at 10ms spacing
+        assert elapsed >= 0.018
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_returns_token(self):
+        """Test a caller cancelled while waiting does not use up budget."""
+        bucket = TokenBucket(rate_per_minute=60, burst=1)  # 1/s
+        await bucket.acquire()
+
+        waiter = asyncio.ensure_future(bucket.acquire())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        # Only the first caller's token is spent: the next wait is ~1s, not ~2s
+        assert bucket._reserve(1) < 1.5
+
+    @pytest.mark.parametrize("value", ["", "None", "0"])
+    def test_rate_limit_can_be_disabled(self, test_config, monkeypatch, value):
+        """Test an empty, None or zero FIRS_RATE_LIMIT_RPM turns the limiter off."""
+        monkeypatch.setenv("FIRS_RATE_LIMIT_RPM", value)
+        config = type(test_config)(**test_config.model_dump(exclude={"rate_limit_rpm"}))
+
+        assert ZutaxAPIClient(config=config)._rate_limiter is None
+
+    def test_rate_limit_off_by_default(self, test_config):
+        """Test existing callers are not paced unless a limit is configured."""
+        assert test_config.rate_limit_rpm is None
+        assert ZutaxAPIClient(config=test_config)._rate_limiter is None
+
+    @pytest.mark.asyncio
+    async def test_client_uses_limiter(self, test_config):
+        """Test awaitable requests acquire a token first."""
+        client = ZutaxAPIClient(config=test_config)
+        client._rate_limiter = Mock(acquire=Mock(side_effect=lambda: asyncio.sleep(0)))
+
+        # aget sends from a worker thread, through that thread's own session
+        with patch.object(
+            requests.Session, "request", Mock(return_value=_response(200, {}))
+        ):
+            response = await client.aget("/api/v1/ping")
+
+        assert response.success is True
+        client._rate_limiter.acquire.assert_called_once_with()
+
+
+class TestThreadSessions:
+    """Test each thread sends through its own session."""
+
+    def test_worker_threads_get_own_session(self, test_config):
+        """Test thread sessions are distinct but share one pooled adapter."""
+        client = ZutaxAPIClient(config=test_config)
+        sessions = []
+        threads = [
+            threading.Thread(target=lambda: sessions.append(client._thread_session()))
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert client._thread_session() is client.session
+        assert len({id(s) for s in [client.session, *sessions]}) == 3
+        url = "https://api-sandbox.firs.gov.ng"
+        adapter = client.session.get_adapter(url)
+        assert all(s.get_adapter(url) is adapter for s in sessions)
+        assert all(s.headers["x-api-key"] == "test-api-key" for s in sessions)
+
+        client.set_auth_credentials("new-key", "new-secret")
+        assert all(s.headers["x-api-key"] == "new-key" for s in sessions)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_use_thread_sessions(self, test_config):
+        """Test concurrent aget calls never share a session across threads."""
+        client = ZutaxAPIClient(config=test_config)
+        owners = {}
+        lock = threading.Lock()
+
+        def request(session, method, url, **kwargs):
+            with lock:
+                owners.setdefault(id(session), set()).add(threading.get_ident())
+            time.sleep(0.01)
+            return _response(200, {})
+
+        with patch.object(requests.Session, "request", autospec=True, side_effect=request):
+            results = await asyncio.gather(
+                *(client.aget(f"/api/v1/ping/{i}") for i in range(8))
+            )
+
+        assert all(r.success for r in results)
+        assert owners and all(len(threads) == 1 for threads in owners.values())
+
+    def test_close_closes_every_session(self, test_config):
+        """Test close() reaches sessions created by worker threads."""
+        client = ZutaxAPIClient(config=test_config)
+        worker = []
+        thread = threading.Thread(target=lambda: worker.append(client._thread_session()))
+        thread.start()
+        thread.join()
+
+        with patch.object(requests.Session, "close", autospec=True) as close:
+            client.close()
+
+        closed = {id(call.args[0]) for call in close.call_args_list}
+        assert {id(client.session), id(worker[0])} <= closed
@@ -129,6 +129,66 @@ class TestLineItemBuilder:
         assert item.notes == "Special instructions"
         assert item.charge_amount == Decimal("5.00")
 
+    def test_decimal_inputs(self, line_item_builder):
+        """Test numeric setters accept Decimal, float and int alike."""
+        price = Decimal("19.99")
+        line_item_builder.with_unit_price(price).with_quantity(3).with_tax(0.1)
+
+        assert line_item_builder._item_data["unit_price"] is price
+        assert line_item_builder._item_data["quantity"] == Decimal("3")
+        assert line_item_builder._item_data["tax_rate"] == Decimal("0.1")
+
+    def test_with_fields(self, line_item_builder):
+        """Test several fields can be set in one call."""
+        line_item_builder.with_fields(description="Mouse", hsn_code="8471")
+
+        assert line_item_builder._item_data["description"] == "Mouse"
+        assert line_item_builder._item_data["hsn_code"] == "8471"
+
+    def test_bulk_build(self):
+        """Test line items are validated directly from rows."""
+        from zutax.builders.line_item_builder import LineItemBuilder
+
+        rows = [
+            {"description": "Laptop", "hsn_code": "8471", "quantity": 1, "unit_price": 1000},
+            {"description": "Mouse", "hsn_code": "8471", "quantity": "2", "unit_price": "25.50"},
+        ]
+        items = LineItemBuilder.bulk_build(rows)
+
+        assert [item.description for item in items] == ["Laptop", "Mouse"]
+        assert items[1].unit_price == Decimal("25.50")
+        assert items[0].tax_rate == Decimal("7.5")
+
+        with pytest.raises(ValidationError):
+            LineItemBuilder.bulk_build([{"description": "No price"}])
+
+    def test_builder_has_no_instance_dict(self, line_item_builder):
+        """Test builder attributes are slot-backed."""
+        assert not hasattr(line_item_builder, "__dict__")
+        with pytest.raises(AttributeError):
+            line_item_builder.unknown = 1
+
+    def test_from_dict(self):
+        """Test builder is populated from a dictionary."""
+        from zutax.builders.line_item_builder import LineItemBuilder
+
+        builder = LineItemBuilder.from_dict({
+            "description": "Laptop",
+            "hsn_code": "8471",
+            "quantity": Decimal("2"),
+            "unit_price": Decimal("1000"),
+            "unit_of_measure": "PCE",
+            "tax_exempt": False,
+            "discount": None,
+            "charges": [{"amount": Decimal("5"), "description": "Handling"}],
+        })
+
+        assert builder._item_data["description"] == "Laptop"
+        assert builder._item_data["unit_of_measure"] == UnitOfMeasure.PIECE
+        assert "discount" not in builder._item_data
+        assert "barcode" not in builder._item_data
+        assert builder._charges[0].description == "Handling"
+
 
 class TestInvoiceBuilder:
     """Test InvoiceBuilder class."""
@@ -1,5 +1,7 @@
 """Tests for FIRS E-Invoice client."""
 
+import threading
+
 import pytest
 from datetime import datetime
 from decimal import Decimal
@@ -48,6 +50,18 @@ class TestFIRSClient:
             assert api_secret == "param-secret"
         assert client.config.business_id == "PARAM-BUS"
     
+    def test_auth_credentials_forwarded(self, test_config):
+        """Test credentials are resolved once and forwarded to the API client."""
+        fake = Mock()
+        with patch("zutax.api.client.api_client", fake):
+            client = FIRSClient(config=test_config)
+            fake.set_auth_credentials.assert_called_once_with(
+                "test-api-key", "test-api-secret"
+            )
+
+            client.set_auth_credentials("new-key", "new-secret")
+            fake.set_auth_credentials.assert_called_with("new-key", "new-secret")
+
     def test_create_invoice_builder(self, client):
         """Test creating invoice builder."""
         builder = client.create_invoice_builder()
@@ -88,7 +102,7 @@ class TestFIRSClient:
     # QR generation tests removed as part of cleanup
     
     @patch('pathlib.Path.mkdir')
-    @patch('pathlib.Path.write_text')
+    @patch('pathlib.Path.write_bytes')
     def test_save_invoice_to_file(self, mock_write, mock_mkdir, client,
                                   sample_supplier, sample_customer):
         """Test saving invoice to file."""
@@ -109,7 +123,7 @@ class TestFIRSClient:
         mock_write.assert_called_once()
     
     @patch('pathlib.Path.mkdir')
-    @patch('pathlib.Path.write_text')
+    @patch('pathlib.Path.write_bytes')
     def test_save_invoice_with_custom_dir(self, mock_write, mock_mkdir, client,
                                           sample_supplier, sample_customer):
         """Test saving invoice to custom directory."""
@@ -132,6 +146,95 @@ class TestFIRSClient:
         assert str(custom_dir) in str(file_path)
         assert "INV-004" in str(file_path)
     
+    def test_save_invoice_writes_json(self, client, sample_supplier,
+                                      sample_customer, tmp_path):
+        """Test saved invoice file is valid JSON with ISO dates."""
+        import json
+
+        invoice = Invoice(
+            invoice_number="INV-009",
+            invoice_date=datetime(2024, 6, 11, 10, 30),
+            invoice_type=InvoiceType.STANDARD,
+            supplier=sample_supplier,
+            customer=sample_customer,
+            line_items=[],
+        )
+
+        file_path = client.save_invoice_to_file(
+            invoice, output_path=str(tmp_path / "invoice.json")
+        )
+
+        assert Path(file_path).parent == tmp_path
+        data = json.loads(Path(file_path).read_text(encoding="utf-8"))
+        assert data["invoice_number"] == "INV-009"
+        assert data["invoice_date"] == "2024-06-11T10:30:00"
+        assert "due_date" not in data
+
+    @pytest.mark.asyncio
+    async def test_save_invoices_to_files(self, client, sample_supplier,
+                                          sample_customer, tmp_path):
+        """Test saving a batch of invoices into one directory."""
+        invoices = [
+            Invoice(
+                invoice_number=f"INV-S{i:03d}",
+                invoice_date=datetime.now(),
+                invoice_type=InvoiceType.STANDARD,
+                supplier=sample_supplier,
+                customer=sample_customer,
+                line_items=[],
+            )
+            for i in range(3)
+        ]
+
+        paths = await client.save_invoices_to_files(
+            invoices, output_dir=str(tmp_path / "batch")
+        )
+
+        assert [Path(p).name for p in paths] == [
+            "invoice_INV-S000.json",
+            "invoice_INV-S001.json",
+            "invoice_INV-S002.json",
+        ]
+        assert all(Path(p).exists() for p in paths)
+
+    @pytest.mark.asyncio
+    async def test_save_invoices_sanitizes_names(self, client, sample_supplier,
+                                                 sample_customer, tmp_path):
+        """Test invoice numbers with '/' do not create subdirectories."""
+        invoice = Invoice(
+            invoice_number="INV/2024/001",
+            invoice_date=datetime.now(),
+            invoice_type=InvoiceType.STANDARD,
+            supplier=sample_supplier,
+            customer=sample_customer,
+            line_items=[],
+        )
+
+        [path] = await client.save_invoices_to_files([invoice], str(tmp_path))
+
+        assert Path(path) == tmp_path / "invoice_INV_2024_001.json"
+
+    @pytest.mark.asyncio
+    async def test_save_invoices_rejects_colliding_names(self, client, sample_supplier,
+                                                         sample_customer, tmp_path):
+        """Test numbers that sanitize to one file name are refused up front."""
+        invoice = Invoice(
+            invoice_number="INV/001",
+            invoice_date=datetime.now(),
+            invoice_type=InvoiceType.STANDARD,
+            supplier=sample_supplier,
+            customer=sample_customer,
+            line_items=[],
+        )
+        # model_copy skips validation, as data loaded from elsewhere may
+        twin = invoice.model_copy(update={"invoice_number": "INV_001"})
+
+        for batch in ([invoice, twin], [invoice, invoice]):
+            with pytest.raises(ValueError, match="invoice_INV_001.json"):
+                await client.save_invoices_to_files(batch, str(tmp_path / "out"))
+
+        assert not (tmp_path / "out").exists()
+
     def test_validate_invoice(self, client, sample_supplier, sample_customer,
                               line_item_builder):
         """Test invoice validation."""
@@ -158,6 +261,58 @@ class TestFIRSClient:
         assert result.valid is True
         assert len(result.errors) == 0
     
+    @pytest.mark.asyncio
+    async def test_batch_validate_invoices(self, client, sample_supplier,
+                                           sample_customer, line_item_builder):
+        """Test batch validation returns one result per invoice, in order."""
+        line_item = (
+            line_item_builder
+            .with_description("Test Product")
+            .with_hsn_code("8471")
+            .with_quantity(1, UnitOfMeasure.PIECE)
+            .with_unit_price(Decimal("10.00"))
+            .build()
+        )
+        invoices = [
+            Invoice(
+                invoice_number=f"INV-B{i:03d}",
+                invoice_date=datetime.now(),
+                invoice_type=InvoiceType.STANDARD,
+                supplier=sample_supplier,
+                customer=sample_customer,
+                line_items=[line_item],
+            )
+            for i in range(3)
+        ]
+
+        # Bypass assignment validation to get an invalid invoice into the batch
+        invoices[1].__dict__["invoice_number"] = "X"
+
+        results = await client.batch_validate_invoices(invoices)
+
+        assert [r.valid for r in results] == [
+            client.validate_invoice(invoice).valid for invoice in invoices
+        ]
+        assert [r.valid for r in results] == [True, False, True]
+
+    @pytest.mark.asyncio
+    async def test_batch_validate_invoices_off_event_loop(self, client):
+        """Test batch validation runs outside the event loop thread."""
+        loop_thread = threading.get_ident()
+        threads = []
+
+        def validate(invoice):
+            threads.append(threading.get_ident())
+            return {"valid": True, "errors": [], "warnings": []}
+
+        with patch(
+            "zutax.client.InvoiceValidator.validate_invoice", side_effect=validate
+        ):
+            results = await client.batch_validate_invoices([Mock(), Mock()])
+
+        assert [r.valid for r in results] == [True, True]
+        assert threads and loop_thread not in threads
+
     @patch('requests.post')
     @pytest.mark.asyncio
     async def test_submit_invoice_success(
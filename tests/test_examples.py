@@ -5,6 +5,8 @@ import os
 import sys
 import asyncio
 from pathlib import Path
+
+import pytest
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -13,6 +15,13 @@ load_dotenv()
 # Add package to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+
+@pytest.fixture(autouse=True)
+def _examples_in_tmp_path(tmp_path, monkeypatch):
+    """Run examples from tmp_path so their ./output files stay out of the tree."""
+    monkeypatch.chdir(tmp_path)
+
+
 def test_simple_invoice():
     """Test the simple invoice example."""
     print("\n" + "="*60)
@@ -0,0 +1,159 @@
+"""Tests for the Zutax invoice API."""
+
+import asyncio
+
+import pytest
+from unittest.mock import Mock, patch
+
+from zutax.api.client import APIResponse
+from zutax.api.invoice import InvoiceAPI
+from zutax.utils.serialization import loads
+
+
+def _status_response(endpoint):
+    return {"irn": endpoint.rsplit("/", 1)[-1], "status": "ACCEPTED"}
+
+
+class TestInvoiceAPI:
+    """Test invoice API calls do not block the event loop."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mock_api", [_status_response], indirect=True, ids=["status"])
+    async def test_get_invoice_status_concurrent(self, mock_api):
+        """Test status lookups overlap when gathered."""
+        results = await asyncio.gather(
+            InvoiceAPI.get_invoice_status("IRN-1"),
+            InvoiceAPI.get_invoice_status("IRN-2"),
+        )
+
+        assert [r["data"]["irn"] for r in results] == ["IRN-1", "IRN-2"]
+        assert mock_api["peak"] == 2
+
+    @pytest.mark.asyncio
+    async def test_shared_client_created_after_import(self, test_config, monkeypatch):
+        """Test calls reach a shared client built after import failed to build one."""
+        import zutax.api.client as api_module
+
+        monkeypatch.setattr(api_module, "api_client", None)
+        monkeypatch.setattr(api_module, "get_config", lambda: test_config)
+
+        async def aget(self, endpoint, params=None, **kwargs):
+            return APIResponse(success=True, data={"irn": endpoint.rsplit("/", 1)[-1]})
+
+        with patch.object(api_module.ZutaxAPIClient, "aget", aget):
+            result = await InvoiceAPI.get_invoice_status("IRN-1")
+
+        assert result == {"success": True, "data": {"irn": "IRN-1"}}
+        assert isinstance(api_module.api_client, api_module.ZutaxAPIClient)
+
+    @pytest.mark.asyncio
+    async def test_cancel_invoice_failure(self, mock_api):
+        """Test failed responses are reported."""
+        result = await InvoiceAPI.cancel_invoice("IRN-1", "duplicate")
+
+        assert result == {"success": False, "error": "HTTP 400"}
+
+    @pytest.mark.asyncio
+    async def test_batch_validate_chunks_preserve_order(self, mock_api):
+        """Test large batches are split into chunks and keep input order."""
+        sizes = []
+
+        async def apost(endpoint, data=None, json=None, **kwargs):
+            batch = loads(data)["invoices"]
+            sizes.append(len(batch))
+            await asyncio.sleep(0.01 * (3 - len(sizes)))
+            return APIResponse(
+                success=True,
+                data={"results": [{"valid": True, "irn": i["n"]} for i in batch]},
+            )
+
+        invoices = [Mock(model_dump_json=Mock(return_value=f'{{"n": "I{i}"}}')) for i in range(5)]
+        fake = Mock(apost=apost, config=Mock(max_batch_size=2))
+        with patch("zutax.api.client.api_client", fake):
+            results = await InvoiceAPI.batch_validate(invoices)
+
+        assert sorted(sizes) == [1, 2, 2]
+        assert [r.irn for r in results] == [f"I{i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_batch_validate_short_chunk_fails_explicitly(self, mock_api):
+        """Test a chunk answered with too few results is marked invalid."""
+
+        async def apost(endpoint, data=None, json=None, **kwargs):
+            batch = loads(data)["invoices"]
+            return APIResponse(
+                success=True,
+                data={"results": [{"valid": True, "irn": i["n"]} for i in batch[1:]]},
+            )
+
+        invoices = [Mock(model_dump_json=Mock(return_value=f'{{"n": "I{i}"}}')) for i in range(3)]
+        fake = Mock(apost=apost, config=Mock(max_batch_size=2))
+        with patch("zutax.api.client.api_client", fake):
+            results = await InvoiceAPI.batch_validate(invoices)
+
+        assert len(results) == 3
+        assert [r.valid for r in results] == [False, False, False]
+        assert results[0].errors == ["Batch validation returned 1 results for 2 invoices"]
+
+    @pytest.mark.asyncio
+    async def test_batch_validate_propagates_cancellation(self, mock_api):
+        """Test a cancelled chunk request is not reported as a failed invoice."""
+
+        async def apost(endpoint, data=None, json=None, **kwargs):
+            raise asyncio.CancelledError()
+
+        invoices = [Mock(model_dump_json=Mock(return_value='{"n": "I0"}'))]
+        fake = Mock(apost=apost, config=Mock(max_batch_size=100))
+        with patch("zutax.api.client.api_client", fake):
+            with pytest.raises(asyncio.CancelledError):
+                await InvoiceAPI.batch_validate(invoices)
+
+    @pytest.mark.asyncio
+    async def test_submit_invoice_serializes_once(self, mock_api):
+        """Test submission reuses one JSON dump for validation and the body."""
+        invoice = Mock(model_dump_json=Mock(return_value='{"invoice_number": "INV-2"}'))
+        sent = {}
+
+        async def apost(endpoint, data=None, json=None, **kwargs):
+            sent["data"] = data
+            return APIResponse(success=True, data={"success": True, "irn": "IRN-2"})
+
+        with patch(
+            "zutax.api.invoice.InvoiceValidator.validate_invoice",
+            return_value={"valid": True, "errors": [], "warnings": []},
+        ), patch("zutax.api.client.api_client.apost", apost):
+            result = await InvoiceAPI.submit_invoice(invoice)
+
+        assert result.success is True
+        assert sent["data"] == b'{"invoice_number": "INV-2"}'
+        invoice.model_dump_json.assert_called_once_with(indent=None)
+
+    @pytest.mark.asyncio
+    async def test_validate_remote_sends_model_json(self, mock_api):
+        """Test the invoice's own JSON dump is sent as the body."""
+        invoice = Mock(model_dump_json=Mock(return_value='{"total": "107.50"}'))
+        sent = {}
+
+        async def apost(endpoint, data=None, json=None, **kwargs):
+            sent["data"] = data
+            return APIResponse(success=True, data={"valid": True})
+
+        with patch("zutax.api.client.api_client.apost", apost):
+            result = await InvoiceAPI.validate_remote(invoice)
+
+        assert result.valid is True
+        assert sent["data"] == b'{"total": "107.50"}'
+        invoice.model_dump.assert_not_called()
+
+    def test_wire_json_is_compact(self):
+        """Test invoices go over the wire without the default indentation."""
+        from decimal import Decimal
+
+        from zutax.api.invoice import _invoice_json
+        from zutax.models.tax import Tax
+
+        tax = Tax(rate=Decimal("7.50"), amount=Decimal("75.00"))
+        payload = _invoice_json(tax)
+
+        assert b"\n" not in payload and b": " not in payload
+        assert loads(payload) == loads(tax.model_dump_json())
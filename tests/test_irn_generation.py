@@ -3,8 +3,9 @@
 
 import os
 import json
-from datetime import datetime
+from datetime import date, datetime
 from dotenv import load_dotenv
+import pytest
 
 # Load environment variables from .env file
 load_dotenv()
@@ -151,5 +152,79 @@ def test_irn_generation():
         print("\n⚠️  Add FIRS_SERVICE_ID to .env for production use!")
 
 
+def test_irn_service_id_normalized():
+    """Service ID from config is truncated to 8 chars and upper-cased."""
+
+    class Config:
+        service_id = "abcd1234xyz"
+
+    irn = IRNGenerator(config=Config()).generate_irn("INV-001")
+    assert irn.startswith("INV-001-ABCD1234-")
+    assert IRNGenerator.validate_irn(irn)
+
+
+def test_irn_date_stamp():
+    """Date stamp uses the issue date when given, else today's date."""
+    assert IRNGenerator._generate_date_stamp(datetime(2024, 6, 1)) == "20240601"
+    assert IRNGenerator._generate_date_stamp() == datetime.now().strftime("%Y%m%d")
+
+
+def test_irn_date_stamp_is_zero_padded():
+    """Date stamp is always 8 digits, for date objects and early years too."""
+    assert IRNGenerator._generate_date_stamp(date(2024, 1, 9)) == "20240109"
+    assert IRNGenerator._generate_date_stamp(datetime(987, 1, 2)) == "09870102"
+
+
+def test_irn_date_stamp_ignores_time():
+    """Every time of day on an issue date yields the same stamp."""
+    stamps = {IRNGenerator._generate_date_stamp(datetime(2024, 6, 11, h)) for h in range(24)}
+    assert stamps == {"20240611"}
+
+
+def test_irn_validate_and_extract():
+    """Validation and extraction agree on well-formed and malformed IRNs."""
+    components = IRNGenerator.extract_components("INV-2024-001-ABCD1234-20240229")
+    assert components == {
+        "invoice_number": "INV-2024-001",
+        "service_id": "ABCD1234",
+        "date_stamp": "20240229",
+        "issue_date": datetime(2024, 2, 29),
+    }
+
+    for bad in (
+        "",
+        "INV001-20240611",
+        "-ABCD1234-20240611",
+        "INV-ABCD1234-20230229",
+        "INV-ABCD123-20240611",
+        "INV-ABCD1234-2024061\u00b2",
+        "INV-ABCD1\u00e934-20240611",
+        "INV-ABCD1234-20240611\n",
+    ):
+        assert not IRNGenerator.validate_irn(bad)
+    with pytest.raises(ValueError):
+        IRNGenerator.extract_components("INV-ABCD1234-20231301")
+
+
+
+def test_irn_invoice_number_with_many_dashes():
+    """Only the last two fields are split off; the invoice number is kept whole."""
+    invoice_number = "-".join(["INV"] + [str(i) for i in range(50)])
+    irn = f"{invoice_number}-ABCD1234-20240611"
+
+    assert IRNGenerator.validate_irn(irn)
+    assert IRNGenerator.extract_components(irn)["invoice_number"] == invoice_number
+
+
+def test_generated_service_id_format():
+    """Generated service IDs are 8 upper-case hex characters."""
+    service_id = IRNGenerator._generate_service_id()
+    assert len(service_id) == 8
+    assert service_id == service_id.upper()
+    int(service_id, 16)
+    irn = IRNGenerator.create_custom_irn("INV-001", issue_date=datetime(2024, 6, 11))
+    assert IRNGenerator.validate_irn(irn)
+
+
 if __name__ == "__main__":
     test_irn_generation()
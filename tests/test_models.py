@@ -1,5 +1,7 @@
 """Tests for FIRS E-Invoice models."""
 
+import json
+
 import pytest
 from datetime import datetime
 from decimal import Decimal
@@ -50,6 +52,19 @@ class TestAddress:
         assert address.postal_code is None
         assert address.street2 is None
     
+    def test_invalid_postal_code(self):
+        """Test the postal code pattern rejects anything but six digits."""
+        from zutax.models.enums import StateCode
+        for postal_code in ("10000", "1000011", "10000A"):
+            with pytest.raises(ValidationError) as exc_info:
+                Address(
+                    street="1 Test Rd",
+                    city="Lagos",
+                    state_code=StateCode.LA,
+                    postal_code=postal_code,
+                )
+            assert exc_info.value.errors()[0]["loc"] == ("postal_code",)
+
     def test_invalid_country(self):
         """Test address with invalid country."""
         from zutax.models.enums import StateCode
@@ -119,6 +134,28 @@ class TestParty:
         assert "phone" in str(exc_info.value).lower()
 
 
+    def test_phone_normalization(self, sample_address):
+        """Test party and contact phones normalize to +234 form alike."""
+        from zutax.models import Contact
+
+        cases = {
+            "0801 234-5678": "+2348012345678",
+            "+234 (801) 234 5678": "+2348012345678",
+            "0801\u2013234\u20135678": "+2348012345678",
+        }
+        for raw, expected in cases.items():
+            party = Party(
+                business_id="PARTY-005",
+                tin="12345678901",
+                name="Phone Company",
+                email="test@phone.com",
+                phone=raw,
+                address=sample_address,
+            )
+            contact = Contact(name="Ada", phone=raw, email="ada@phone.com")
+            assert party.phone == contact.phone == expected
+
+
 class TestLineItem:
     """Test LineItem model."""
     
@@ -171,6 +208,97 @@ class TestLineItem:
         assert item.tax_amount == Decimal("0")
         assert item.line_total == Decimal("1000.00")  # No tax added
     
+    def test_amounts_follow_inputs(self):
+        """Test derived amounts refresh on assignment and supplied ones are kept."""
+        item = LineItem(
+            description="Test Product",
+            hsn_code="8471",
+            quantity=Decimal("3"),
+            unit_price=Decimal("33.33"),
+            tax_amount=Decimal("1.00"),
+        )
+        assert item.base_amount == Decimal("99.99")
+        assert item.line_total == Decimal("100.99")
+
+        item.quantity = Decimal("2")
+
+        assert item.base_amount == Decimal("66.66")
+        assert item.tax_amount == Decimal("1.00")
+        assert item.line_total == Decimal("67.66")
+        assert LineItem.model_validate(item.model_dump()) == item
+
+    def test_derived_amounts_are_cents_and_round_trip(self):
+        """Test every derived amount is cent-quantized and re-validates."""
+        from zutax.models import Discount
+
+        item = LineItem(
+            description="Fixed Discount",
+            hsn_code="8471",
+            quantity=Decimal("1"),
+            unit_price=Decimal("100"),
+            discount=Discount(amount=Decimal("40")),
+            tax_exemption_reason="Exempt",
+        )
+
+        for name in ("base_amount", "discount_amount", "charge_amount",
+                     "taxable_amount", "tax_amount", "line_total"):
+            assert getattr(item, name).as_tuple().exponent == -2, name
+        assert item.taxable_amount == Decimal("60.00")
+        assert LineItem.model_validate(item.model_dump()) == item
+
+    def test_discount_larger_than_line_rejected(self):
+        """Test a discount above the line amount fails validation."""
+        from zutax.models import Discount
+
+        with pytest.raises(ValidationError, match="Discount cannot exceed"):
+            LineItem(
+                description="Over Discounted",
+                hsn_code="8471",
+                quantity=Decimal("1"),
+                unit_price=Decimal("100"),
+                discount=Discount(amount=Decimal("500")),
+            )
+
+    def test_numeric_inputs_coerced_to_decimal(self):
+        """Test int, float and str inputs become exact Decimals."""
+        item = LineItem(
+            description="Coerced Product",
+            hsn_code="8471",
+            quantity=3,
+            unit_price=0.1,
+            tax_rate="7.5",
+        )
+
+        assert item.quantity == Decimal("3")
+        assert item.unit_price == Decimal("0.1")
+        assert item.tax_rate == Decimal("7.5")
+        assert item.base_amount == Decimal("0.30")
+
+    def test_discount_amount_or_percent(self):
+        """Test a discount takes an amount or a percentage, not both."""
+        from zutax.models import Discount
+
+        assert Discount(percent=Decimal("10")).amount is None
+        assert Discount(amount=Decimal("5.00")).percent is None
+        with pytest.raises(ValidationError, match="Cannot specify both"):
+            Discount(amount=Decimal("5.00"), percent=Decimal("10"))
+
+        discount = Discount(amount=Decimal("5.00"))
+        with pytest.raises(ValidationError, match="Cannot specify both"):
+            discount.percent = Decimal("10")
+
+    def test_invalid_hsn_code(self):
+        """Test the HSN code pattern rejects non-digits and bad lengths."""
+        for hsn_code in ("84A1", "847", "123456789"):
+            with pytest.raises(ValidationError) as exc_info:
+                LineItem(
+                    description="Bad HSN",
+                    hsn_code=hsn_code,
+                    quantity=Decimal("1"),
+                    unit_price=Decimal("1.00"),
+                )
+            assert exc_info.value.errors()[0]["loc"] == ("hsn_code",)
+
     def test_invalid_quantity(self):
         """Test line item with invalid quantity."""
         with pytest.raises(ValidationError) as exc_info:
@@ -273,6 +401,33 @@ class TestInvoice:
         assert invoice.total_tax == Decimal("60.000")  # 7.5% of 800
         assert invoice.total_amount == Decimal("860.000")  # 800 + 60
     
+    def test_from_trusted_dict_rebuilds_tree(self, sample_supplier, sample_customer):
+        """Test trusted data rebuilds nested models equal to the validated invoice."""
+        from zutax.models import Charge
+
+        item = LineItem(
+            description="Product",
+            hsn_code="8471",
+            quantity=Decimal("2"),
+            unit_price=Decimal("100.00"),
+            discount_percent=Decimal("10"),
+            charges=[Charge(amount=Decimal("5.00"), description="Handling")],
+        )
+        invoice = Invoice(
+            invoice_number="INV-004",
+            invoice_date=datetime.now(),
+            supplier=sample_supplier,
+            customer=sample_customer,
+            line_items=[item],
+        )
+
+        rebuilt = Invoice.from_trusted_dict(invoice.model_dump())
+
+        assert rebuilt == invoice
+        assert isinstance(rebuilt.supplier.address, Address)
+        assert isinstance(rebuilt.line_items[0].charges[0], Charge)
+        assert rebuilt.total_amount == invoice.total_amount
+
     def test_invalid_invoice_number(self, sample_supplier, sample_customer):
         """Test invoice with invalid invoice number."""
         with pytest.raises(ValidationError) as exc_info:
@@ -318,4 +473,76 @@ class TestInvoice:
         )
         
         assert invoice.currency == Currency.USD
-        assert invoice.exchange_rate == Decimal("1.25")
\ No newline at end of file
+        assert invoice.exchange_rate == Decimal("1.25")
+
+
+class TestSerialization:
+    """Test JSON serialization of SDK models."""
+
+    def test_model_dump_json_native(self):
+        """Test JSON output keeps enum values, string Decimals and drops None."""
+        from zutax.models.tax import Tax
+
+        tax = Tax(category=TaxCategory.VAT, rate=Decimal("7.50"), amount=Decimal("75.00"))
+        data = json.loads(tax.model_dump_json())
+
+        assert data == {"category": TaxCategory.VAT.value, "rate": "7.50", "amount": "75.00"}
+        assert tax.model_dump_json(indent=None) == json.dumps(data, separators=(",", ":"))
+
+    def test_model_dump_returns_enum_values(self):
+        """Test model_dump emits enum values without a post-processing walk."""
+        from zutax.models.base import FIRSBaseModel
+
+        class Typed(FIRSBaseModel):
+            invoice_type: InvoiceType
+
+        data = Typed(invoice_type=InvoiceType.STANDARD).model_dump()
+
+        assert data == {"invoice_type": InvoiceType.STANDARD.value}
+        assert type(data["invoice_type"]) is str
+
+
+class TestBaseModelConfig:
+    """Test the configuration inherited by strict models."""
+
+    def test_strict_config_extends_base(self):
+        """Test strict models keep the base config and add no private attributes."""
+        from zutax.models.base import FIRSBaseModel, StrictBaseModel
+
+        config = StrictBaseModel.model_config
+        assert config["extra"] == "forbid"
+        assert config["str_min_length"] == 1
+        assert config["validate_assignment"] is FIRSBaseModel.model_config["validate_assignment"]
+        assert StrictBaseModel.__private_attributes__ == {}
+
+    def test_compute_models_skip_assignment_validation(self):
+        """Test calculation results validate on construction but not on assignment."""
+        from zutax.models import TaxBreakdown, TaxDetail
+
+        with pytest.raises(ValidationError):
+            TaxBreakdown(subtotal=Decimal("-1"), taxable_amount=Decimal("0"))
+
+        breakdown = TaxBreakdown(subtotal=Decimal("100"), taxable_amount=Decimal("100"))
+        detail = TaxDetail(
+            category=TaxCategory.VAT,
+            rate=Decimal("7.5"),
+            taxable_amount=Decimal("100"),
+            tax_amount=Decimal("7.50"),
+        )
+        breakdown.taxable_amount += Decimal("0.001")
+        breakdown.tax_details.append(detail)
+
+        assert breakdown.taxable_amount == Decimal("100.001")
+        assert breakdown.total_tax == Decimal("7.50")
+        assert TaxDetail.model_config["validate_assignment"] is True
+
+    def test_breakdown_totals_are_decimal_when_empty(self):
+        """Test breakdown totals start from Decimal zero, not int 0."""
+        from zutax.models import TaxBreakdown
+
+        breakdown = TaxBreakdown(subtotal=Decimal("100"), taxable_amount=Decimal("100"))
+
+        assert type(breakdown.total_tax) is Decimal
+        assert type(breakdown.total_exempt) is Decimal
+        assert breakdown.total_amount == Decimal("100")
+        assert breakdown.model_dump()["total_tax"] == Decimal("0")
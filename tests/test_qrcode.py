@@ -0,0 +1,129 @@
+"""Tests for FIRS QR code generation."""
+
+import base64
+import io
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("Crypto")
+pytest.importorskip("qrcode")
+
+from PIL import Image  # noqa: E402
+
+from zutax.crypto.firs_qrcode import FIRSQRCodeGenerator  # noqa: E402
+
+PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+
+
+@pytest.fixture
+def generator(rsa_key):
+    """Provide a QR generator configured with the test public key."""
+    config = SimpleNamespace(
+        firs_public_key=base64.b64encode(rsa_key.publickey().export_key()).decode("utf-8"),
+        firs_certificate="dGVzdC1jZXJ0aWZpY2F0ZQ==",
+    )
+    return FIRSQRCodeGenerator(config=config)
+
+
+class TestFIRSQRCodeGenerator:
+    """Test single and batch QR generation."""
+
+    def test_generate_qr_code_returns_png(self, generator):
+        """Test a single QR code is a base64 PNG."""
+        png = base64.b64decode(generator.generate_qr_code("INV001-ABCD1234-20240611"))
+
+        assert png.startswith(PNG_MAGIC)
+        with Image.open(io.BytesIO(png)) as image:
+            image.load()  # fast-compressed PNG still decodes fully
+            assert image.width == image.height
+
+    def test_signer_built_once_per_generator(self, generator, monkeypatch):
+        """Test repeated QR calls reuse the generator's signer."""
+        from zutax.crypto import firs_signing
+
+        built = []
+        original_init = firs_signing.FIRSSigner.__init__
+
+        def counting_init(self, *args, **kwargs):
+            built.append(self)
+            original_init(self, *args, **kwargs)
+
+        monkeypatch.setattr(firs_signing.FIRSSigner, "__init__", counting_init)
+
+        generator.generate_qr_code("INV001-ABCD1234-20240611")
+        generator.generate_qr_code("INV002-ABCD1234-20240611")
+
+        assert len(built) == 1
+
+    def test_batch_reuses_one_qrcode(self, generator, monkeypatch):
+        """Test the batch builds one QRCode and each result is a full PNG."""
+        created = []
+        original = FIRSQRCodeGenerator._new_qr_code
+
+        def counting_new_qr_code(options):
+            created.append(options)
+            return original(options)
+
+        monkeypatch.setattr(
+            FIRSQRCodeGenerator, "_new_qr_code", staticmethod(counting_new_qr_code)
+        )
+        invoices = [SimpleNamespace(irn=f"INV{i:03d}-ABCD1234-20240611") for i in range(3)]
+
+        results = generator.generate_multiple_qr_codes(invoices)
+
+        assert len(created) == 1
+        assert [r["irn"] for r in results] == [inv.irn for inv in invoices]
+        for result in results:
+            assert result["success"] is True
+            assert base64.b64decode(result["qr_code"]).startswith(PNG_MAGIC)
+
+    def test_batch_writes_files(self, generator, tmp_path):
+        """Test batch output to a directory writes one PNG per invoice."""
+        invoices = [SimpleNamespace(irn="INV001-ABCD1234-20240611")]
+
+        results = generator.generate_multiple_qr_codes(invoices, output_dir=str(tmp_path / "qr"))
+
+        assert results[0]["success"] is True
+        with open(results[0]["file_path"], "rb") as f:
+            assert f.read(8) == PNG_MAGIC
+
+    def test_batch_reports_unconfigured_signer(self, monkeypatch):
+        """Test a missing key fails each invoice without raising."""
+        monkeypatch.delenv("FIRS_PUBLIC_KEY", raising=False)
+        monkeypatch.delenv("FIRS_CERTIFICATE", raising=False)
+        generator = FIRSQRCodeGenerator(config=SimpleNamespace())
+
+        results = generator.generate_multiple_qr_codes([SimpleNamespace(irn="INV001")])
+
+        assert results[0]["success"] is False
+        assert "not configured" in results[0]["error"]
+
+    def test_batch_keeps_order_and_isolates_errors(self, generator):
+        """Test batch results keep input order and per-invoice errors."""
+        invoices = [
+            SimpleNamespace(irn="INV001-ABCD1234-20240611"),
+            SimpleNamespace(),
+            SimpleNamespace(irn="INV003-ABCD1234-20240611"),
+        ]
+
+        results = generator.generate_multiple_qr_codes(invoices)
+
+        assert [r["success"] for r in results] == [True, False, True]
+        assert results[1]["irn"] == "invoice_2"
+        assert results[2]["irn"] == "INV003-ABCD1234-20240611"
+        assert base64.b64decode(results[2]["qr_code"]).startswith(PNG_MAGIC)
+
+    @pytest.mark.parametrize(
+        "data, expected",
+        [
+            ("dGVzdA==", True),
+            ("", True),
+            ("dGVzdA=", False),
+            ("dGV*zdA==", False),
+            ("not base64!", False),
+        ],
+    )
+    def test_validate_qr_data(self, data, expected):
+        """Test base64 validation rejects stray characters and bad padding."""
+        assert FIRSQRCodeGenerator.validate_qr_data(data) is expected
@@ -0,0 +1,233 @@
+"""Tests for the Zutax resource cache."""
+
+import asyncio
+import time
+
+import pytest
+
+from zutax.cache.resource_cache import ResourceCache, get_resource_cache, resource_cache
+
+
+@pytest.fixture
+def cache():
+    """Provide the shared cache, emptied before and after each test."""
+    resource_cache.clear()
+    yield resource_cache
+    resource_cache.clear()
+
+
+class TestResourceCache:
+    """Test cache reads, writes and expiry."""
+
+    def test_set_get(self, cache):
+        """Test values round-trip and unknown keys miss."""
+        cache.set("states", ["LA"], ttl=60)
+
+        assert cache.get("states") == ["LA"]
+        assert cache.get("missing") is None
+        assert cache.has("states")
+
+    def test_expired_entries_evicted(self, cache):
+        """Test expired keys miss and are dropped without a full sweep."""
+        cache.set("short", 1, ttl=0.01)
+        cache.set("long", 2, ttl=60)
+        time.sleep(0.02)
+
+        assert cache.get("short") is None
+        assert cache.get_keys() == ["long"]
+        assert cache.get_stats()["keys"] == 1
+
+    def test_reset_key_keeps_latest_expiry(self, cache):
+        """Test a stale heap item does not evict a re-set key."""
+        cache.set("states", ["old"], ttl=0.01)
+        cache.set("states", ["new"], ttl=60)
+        time.sleep(0.02)
+
+        assert cache.get_keys() == ["states"]
+        assert cache.get("states") == ["new"]
+
+    def test_wall_clock_jump_does_not_expire(self, cache, monkeypatch):
+        """Test expiry follows the monotonic clock, not wall-clock time."""
+        cache.set("states", ["LA"], ttl=60)
+        wall = time.time()
+        monkeypatch.setattr(time, "time", lambda: wall + 3600)
+
+        assert cache.get("states") == ["LA"]
+        assert 0 < cache.get_ttl("states") <= 60
+
+    def test_disk_expiry_is_wall_clock(self, cache, tmp_path, monkeypatch):
+        """Test the disk tier stores wall-clock expiry that reloads correctly."""
+        monkeypatch.setattr(cache, "disk_path", tmp_path)
+        cache.set("states", ["LA"], ttl=60)
+        cache._cache.clear()  # simulate a new process
+
+        assert cache.get("states") == ["LA"]
+        assert 55 < cache.get_ttl("states") <= 60
+
+    def test_get_many_counts_hits_and_misses(self, cache):
+        """Test batch reads skip expired keys and update stats."""
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=0.01)
+        time.sleep(0.02)
+        before = cache.get_stats()
+
+        assert cache.get_many(["a", "b", "c"]) == {"a": 1}
+        stats = cache.get_stats()
+        assert stats["hits"] - before["hits"] == 1
+        assert stats["misses"] - before["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_get_or_set_coalesces_concurrent_misses(self, cache):
+        """Test concurrent callers for a cold key share one factory call."""
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return ["LA"]
+
+        results = await asyncio.gather(
+            *(cache.get_or_set("states", factory) for _ in range(5))
+        )
+
+        assert results == [["LA"]] * 5
+        assert calls == 1
+        assert cache.get("states") == ["LA"]
+
+    @pytest.mark.asyncio
+    async def test_get_or_set_shares_errors(self, cache):
+        """Test a failing factory raises for every waiter and is not cached."""
+
+        async def factory():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        results = await asyncio.gather(
+            cache.get_or_set("states", factory),
+            cache.get_or_set("states", factory),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert cache.get("states") is None
+
+    def test_disk_write_failure_logged(self, cache, tmp_path, monkeypatch, caplog):
+        """Test disk tier errors are logged at DEBUG and do not fail set()."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        monkeypatch.setattr(cache, "disk_path", blocker / "cache")
+
+        with caplog.at_level("DEBUG", logger="zutax.cache.resource_cache"):
+            assert cache.set("states", ["LA"], ttl=60) is True
+
+        assert "Cache disk write failed for states" in caplog.text
+
+    def test_stats_size_tracks_entries(self, cache):
+        """Test the size estimate grows on set and returns to zero."""
+        cache.set("states", ["LA", "AB"], ttl=60)
+        size = cache.get_stats()["size"]
+        assert size > 0
+
+        cache.set("states", ["LA", "AB"], ttl=60)
+        assert cache.get_stats()["size"] == size
+
+        cache.delete("states")
+        assert cache.get_stats()["size"] == 0
+
+    def test_shared_instance_from_factory(self, cache):
+        """Test the factory returns the shared cache and new instances are separate."""
+        assert get_resource_cache() is resource_cache
+
+        other = ResourceCache()
+        other.set("states", ["LA"], ttl=60)
+
+        assert other is not resource_cache
+        assert resource_cache.get("states") is None
+
+    def test_lru_eviction_bounds_size(self):
+        """Test the least recently used key is evicted past maxsize."""
+        cache = ResourceCache()
+        cache.maxsize = 2
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        assert cache.get("a") == 1
+
+        cache.set("c", 3, ttl=60)
+
+        assert cache.get("b") is None
+        assert sorted(cache.get_keys()) == ["a", "c"]
+        assert cache.get_stats()["size"] == sum(
+            cache._entry_size(k, e) for k, e in cache._cache.items()
+        )
+
+    def test_create_key_is_interned(self):
+        """Test equal keys built separately are the same object."""
+        key = ResourceCache.create_key("lgas", "LA")
+
+        assert key == "lgas:LA"
+        assert ResourceCache.create_key("lgas", "L" + "A") is key
+
+    def test_disk_tier_shared_between_instances(self, tmp_path):
+        """Test a second cache on the same directory reads the first's entries."""
+        writer = ResourceCache()
+        reader = ResourceCache()
+        writer.disk_path = reader.disk_path = tmp_path
+
+        writer.set("states", ["LA"], ttl=60)
+
+        assert reader.get("states") == ["LA"]
+        assert [p.name for p in tmp_path.iterdir()] == [writer._disk_file("states").name]
+        assert writer._disk_file("states").name.startswith("states.")
+
+    def test_disk_keys_do_not_collide(self, tmp_path):
+        """Test keys that sanitize to the same name keep separate files."""
+        writer = ResourceCache()
+        reader = ResourceCache()
+        writer.disk_path = reader.disk_path = tmp_path
+
+        writer.set("vat:exemptions", ["colon"], ttl=60)
+        writer.set("vat_exemptions", ["underscore"], ttl=60)
+
+        assert reader.get("vat:exemptions") == ["colon"]
+        assert reader.get("vat_exemptions") == ["underscore"]
+        assert len(list(tmp_path.iterdir())) == 2
+
+    def test_clear_keeps_foreign_files(self, tmp_path):
+        """Test clear() removes only the disk tier's own files."""
+        cache = ResourceCache()
+        cache.disk_path = tmp_path
+        (tmp_path / "settings.json").write_text("{}")
+        cache.set("states", ["LA"], ttl=60)
+
+        cache.clear()
+
+        assert [p.name for p in tmp_path.iterdir()] == ["settings.json"]
+
+    def test_get_many_reads_disk_tier(self, tmp_path):
+        """Test batch reads fall back to the disk tier like get()."""
+        writer = ResourceCache()
+        reader = ResourceCache()
+        writer.disk_path = reader.disk_path = tmp_path
+        writer.set_many(
+            [{"key": "a", "value": 1, "ttl": 60}, {"key": "b", "value": [2], "ttl": 60}]
+        )
+
+        assert reader.get_many(["a", "b", "c"]) == {"a": 1, "b": [2]}
+        assert sorted(reader.get_keys()) == ["a", "b"]
+        assert reader.get_stats()["misses"] == 1
+
+    def test_set_many_matches_individual_sets(self, cache):
+        """Test batch writes store, expire and size entries like set()."""
+        assert cache.set_many(
+            [
+                {"key": "a", "value": 1, "ttl": 60},
+                {"key": "b", "value": [2], "ttl": 0.01},
+                {"key": "a", "value": 3, "ttl": 60},
+            ]
+        )
+        time.sleep(0.02)
+
+        assert cache.get_many(["a", "b"]) == {"a": 3}
+        assert cache.get_keys() == ["a"]
+        assert cache.get_stats()["size"] == cache._entry_size("a", cache._cache["a"])
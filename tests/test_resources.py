@@ -0,0 +1,140 @@
+"""Tests for the Zutax resources API."""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+from zutax.api.resources import ResourceAPI, State
+from zutax.cache.resource_cache import resource_cache
+
+
+RESOURCE_DATA = {
+    "vat-exemptions": [
+        {"code": "VE1", "description": "Medical", "category": "MEDICAL"}
+    ],
+    "product-codes": [{"code": "P1", "description": "Laptop"}],
+    "service-codes": [
+        {"code": "S1", "description": "Consulting", "category": "PRO"}
+    ],
+    "states": [{"code": "LA", "name": "Lagos"}],
+    "lgas": [{"code": "IKJ", "name": "Ikeja", "state_code": "LA"}],
+    "invoice-types": [
+        {"code": "380", "description": "Commercial", "category": "STD"}
+    ],
+    "tax-categories": [{"code": "VAT", "description": "VAT", "rate": 7.5}],
+}
+
+
+def _resource_response(endpoint):
+    return RESOURCE_DATA[endpoint.split("?")[0].rsplit("/", 1)[-1]]
+
+
+pytestmark = pytest.mark.parametrize(
+    "mock_api", [_resource_response], indirect=True, ids=["resources"]
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_resource_cache():
+    """Keep cached resources from leaking between tests."""
+    resource_cache.clear()
+    yield
+    resource_cache.clear()
+
+
+class TestResourceAPI:
+    """Test resource fetching and preloading."""
+
+    @pytest.mark.asyncio
+    async def test_get_states(self, mock_api):
+        """Test resource payloads are parsed into models."""
+        states = await ResourceAPI.get_states()
+        assert states == [State(code="LA", name="Lagos")]
+
+    @pytest.mark.asyncio
+    async def test_preload_resources_concurrent(self, mock_api):
+        """Test preload fetches every resource concurrently and caches it."""
+        results = await ResourceAPI.preload_resources()
+
+        assert set(results) == {
+            "vat_exemptions",
+            "product_codes",
+            "service_codes",
+            "states",
+            "lgas",
+            "invoice_types",
+            "tax_categories",
+        }
+        assert mock_api["peak"] > 1
+        assert resource_cache.get("states") == results["states"]
+
+    @pytest.mark.asyncio
+    async def test_preload_resources_partial_failure(self, mock_api, caplog):
+        """Test a failing resource is skipped while the rest still load."""
+
+        async def boom():
+            raise RuntimeError("upstream down")
+
+        with patch.object(ResourceAPI, "get_lgas", boom):
+            results = await ResourceAPI.preload_resources()
+
+        assert "lgas" not in results
+        assert results["states"] == [State(code="LA", name="Lagos")]
+        assert "Failed to preload lgas: upstream down" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_preload_resources_propagates_cancellation(self, mock_api):
+        """Test a cancelled fetch is re-raised rather than stored as data."""
+
+        async def cancelled():
+            raise asyncio.CancelledError()
+
+        with patch.object(ResourceAPI, "get_lgas", cancelled):
+            with pytest.raises(asyncio.CancelledError):
+                await ResourceAPI.preload_resources()
+
+    @pytest.mark.asyncio
+    async def test_preload_resources_concurrency_limit(self, mock_api):
+        """Test PRELOAD_CONCURRENCY caps in-flight requests."""
+        with patch.object(ResourceAPI, "PRELOAD_CONCURRENCY", 2):
+            results = await ResourceAPI.preload_resources()
+
+        assert len(results) == 7
+        assert mock_api["peak"] == 2
+
+    @pytest.mark.asyncio
+    async def test_getters_read_through_cache(self, mock_api):
+        """Test repeated getter calls are served from the cache."""
+        await ResourceAPI.get_states()
+        await ResourceAPI.get_states()
+        await ResourceAPI.get_lgas("LA")
+
+        assert mock_api["count"] == 2
+        assert resource_cache.has("lgas:LA")
+
+    @pytest.mark.asyncio
+    async def test_replay_mode_raises_on_miss(self, mock_api, monkeypatch):
+        """Test replay mode refuses to call the API on a cache miss."""
+        monkeypatch.setenv("FIRS_RESOURCE_REPLAY", "true")
+
+        with pytest.raises(LookupError):
+            await ResourceAPI.get_states()
+        assert mock_api["count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_restart(self, mock_api, tmp_path, monkeypatch):
+        """Test resources reload from disk when memory is cold."""
+        monkeypatch.setattr(resource_cache, "disk_path", tmp_path)
+
+        await ResourceAPI.get_states()
+        assert resource_cache._disk_file("states").exists()
+
+        resource_cache._cache.clear()  # simulate a new process
+        states = await ResourceAPI.get_states()
+
+        assert states == [State(code="LA", name="Lagos")]
+        assert mock_api["count"] == 1
+
+        resource_cache.clear()
+        assert list(tmp_path.glob("*.json")) == []
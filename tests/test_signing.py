@@ -0,0 +1,159 @@
+"""Tests for FIRS IRN signing."""
+
+import base64
+import json
+import logging
+
+import pytest
+
+Crypto = pytest.importorskip("Crypto")
+
+from Crypto.Cipher import PKCS1_v1_5  # noqa: E402
+
+from zutax.crypto.firs_signing import (  # noqa: E402
+    FIRSSigner,
+    FIRSSigningPayload,
+    get_firs_signer,
+)
+
+
+@pytest.fixture
+def signer(rsa_key):
+    """Provide a signer configured with the test public key."""
+
+    class Config:
+        firs_public_key = base64.b64encode(
+            rsa_key.publickey().export_key()
+        ).decode("utf-8")
+        firs_certificate = "dGVzdC1jZXJ0aWZpY2F0ZQ=="
+
+    return FIRSSigner(config=Config())
+
+
+def _decrypt(rsa_key, encrypted_base64):
+    cipher = PKCS1_v1_5.new(rsa_key)
+    plain = cipher.decrypt(base64.b64decode(encrypted_base64), None)
+    return json.loads(plain)
+
+
+class TestFIRSSigner:
+    """Test IRN signing and encryption."""
+
+    def test_sign_irn_round_trip(self, signer, rsa_key):
+        """Test the encrypted payload decrypts to IRN.timestamp + cert."""
+        result = signer.sign_irn("INV001-ABCD1234-20240611", timestamp=1718000000)
+
+        assert result.timestamp == 1718000000
+        assert result.irn_with_timestamp == "INV001-ABCD1234-20240611.1718000000"
+        assert _decrypt(rsa_key, result.encrypted_data) == {
+            "irn": "INV001-ABCD1234-20240611.1718000000",
+            "certificate": "dGVzdC1jZXJ0aWZpY2F0ZQ==",
+        }
+
+    def test_encrypt_for_qr_round_trip(self, rsa_key):
+        """Test the static helper accepts a raw PEM public key."""
+        pem = rsa_key.publickey().export_key().decode("utf-8")
+
+        encrypted = FIRSSigner.encrypt_for_qr("INV001-ABCD1234-20240611", "cert", pem)
+
+        payload = _decrypt(rsa_key, encrypted)
+        assert payload["irn"].startswith("INV001-ABCD1234-20240611.")
+        assert payload["certificate"] == "cert"
+
+    def test_cipher_reused_across_calls(self, signer):
+        """Test the public key is parsed once for repeated signing."""
+        from zutax.crypto.firs_signing import _cipher_for_pem
+
+        _cipher_for_pem.cache_clear()
+        signer.sign_irn("INV001-ABCD1234-20240611", timestamp=1)
+        signer.sign_irn("INV002-ABCD1234-20240611", timestamp=2)
+
+        info = _cipher_for_pem.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+    def test_repeated_irn_encrypted_afresh(self, signer, rsa_key):
+        """Test a repeated IRN and timestamp gets a new, randomized ciphertext."""
+        first = signer.sign_irn("INV001-ABCD1234-20240611", timestamp=1718000000)
+        second = signer.sign_irn("INV001-ABCD1234-20240611", timestamp=1718000000)
+
+        assert first.encrypted_data != second.encrypted_data
+        assert _decrypt(rsa_key, first.encrypted_data) == _decrypt(
+            rsa_key, second.encrypted_data
+        )
+        assert _decrypt(rsa_key, second.encrypted_data)["irn"].endswith(".1718000000")
+
+    def test_get_firs_signer_is_shared(self, rsa_key, monkeypatch):
+        """Test the env-loaded signer is built once until the cache is cleared."""
+        monkeypatch.setenv(
+            "FIRS_PUBLIC_KEY",
+            base64.b64encode(rsa_key.publickey().export_key()).decode("utf-8"),
+        )
+        monkeypatch.setenv("FIRS_CERTIFICATE", "cert")
+        get_firs_signer.cache_clear()
+        try:
+            signer = get_firs_signer()
+
+            assert signer.is_configured()
+            assert get_firs_signer() is signer
+        finally:
+            get_firs_signer.cache_clear()
+
+    def test_signing_never_outputs_certificate(self, signer, capsys, caplog):
+        """Test signing writes nothing to stdout and logs only the IRN."""
+        with caplog.at_level(logging.DEBUG, logger="zutax.crypto.firs_signing"):
+            signer.sign_irn("INV001-ABCD1234-20240611", timestamp=1718000001)
+
+        assert capsys.readouterr().out == ""
+        assert "INV001-ABCD1234-20240611.1718000001" in caplog.text
+        assert signer.get_certificate() not in caplog.text
+
+    @pytest.mark.parametrize(
+        "irn, certificate",
+        [
+            ("INV001-ABCD1234-20240611.1718000000", "dGVzdC1jZXJ0aWZpY2F0ZQ=="),
+            ('INV"001', "back\\slash"),
+            ("INV\n001", "caf\u00e9"),
+        ],
+    )
+    def test_payload_json_matches_serializer(self, irn, certificate):
+        """Test the hand-built payload equals the model's compact JSON."""
+        payload = FIRSSigningPayload(irn=irn, certificate=certificate)
+
+        assert payload.to_json_bytes() == payload.__pydantic_serializer__.to_json(payload)
+        assert json.loads(payload.to_json_bytes()) == {"irn": irn, "certificate": certificate}
+
+
+class TestCryptoPackage:
+    """Test lazy exports of the zutax.crypto package."""
+
+    def test_exports_resolve_lazily(self):
+        """Test __all__ names resolve to the submodule objects."""
+        import zutax.crypto as crypto
+        from zutax.crypto import firs_qrcode, firs_signing, irn
+
+        assert crypto.FIRSSigner is firs_signing.FIRSSigner
+        assert crypto.get_firs_signer is firs_signing.get_firs_signer
+        assert crypto.FIRSQRCodeOptions is firs_qrcode.FIRSQRCodeOptions
+        assert crypto.IRNGenerator is irn.IRNGenerator
+        assert set(crypto.__all__) <= set(dir(crypto))
+
+    def test_unknown_name_raises_attribute_error(self):
+        """Test unknown names fail like a normal module attribute."""
+        import zutax.crypto as crypto
+
+        with pytest.raises(AttributeError):
+            crypto.NotAThing  # noqa: B018
+
+    def test_sdk_import_does_not_load_qr_dependencies(self):
+        """Test importing zutax defers qrcode/Pillow until QR is used."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, zutax, zutax.crypto\n"
+            "assert 'qrcode' not in sys.modules\n"
+            "assert 'zutax.crypto.firs_qrcode' not in sys.modules\n"
+            "assert zutax.FIRSQRCodeGenerator is not None\n"
+            "assert 'qrcode' in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,172 @@
+"""Tests for tax calculations."""
+
+from decimal import Decimal, ROUND_HALF_EVEN, localcontext
+
+from zutax.managers import TaxManager
+
+
+class TestTaxManager:
+    """Test TaxManager arithmetic and categorization."""
+
+    def test_line_tax_rounds_half_up(self):
+        """Test percentages are rounded half-up to the cent."""
+        calc = TaxManager.calculate_line_tax(10.05, custom_rate=7.5)
+
+        assert calc.tax_amount == Decimal("0.75")
+        assert calc.base_amount == Decimal("10.05")
+
+    def test_rounding_ignores_thread_context(self):
+        """Test amounts round half-up whatever the caller's decimal context."""
+        with localcontext(rounding=ROUND_HALF_EVEN):
+            calc = TaxManager.calculate_line_tax(3, custom_rate=7.5)
+
+        assert calc.tax_amount == Decimal("0.23")
+
+    def test_decimal_and_float_inputs_agree(self):
+        """Test Decimal, int and float inputs give identical results."""
+        assert TaxManager.calculate_withholding_tax(Decimal("199.99"), Decimal("7.5")) == (
+            TaxManager.calculate_withholding_tax(199.99, 7.5)
+        )
+        assert TaxManager.calculate_withholding_tax(200, 10) == Decimal("20.00")
+
+    def test_reverse_tax(self):
+        """Test tax-inclusive totals split into base and tax."""
+        result = TaxManager.calculate_reverse_tax(107.5, 7.5)
+
+        assert result == {"base_amount": Decimal("100.00"), "tax_amount": Decimal("7.50")}
+        assert TaxManager.validate_tax_calculation(100, 7.5, 7.5)
+        assert not TaxManager.validate_tax_calculation(100, 7.6, 7.5)
+
+    def test_multiple_taxes_breakdown(self):
+        """Test taxes are bucketed by category and totalled."""
+        breakdown = TaxManager.calculate_multiple_taxes(
+            1000,
+            [
+                {"category": "VAT", "rate": 7.5},
+                {"category": "EXCISE", "rate": 10},
+                {"category": "CUSTOMS", "rate": 5},
+                {"category": "WITHHOLDING", "rate": 2.5},
+            ],
+        )
+
+        assert breakdown.vat == Decimal("75.00")
+        assert breakdown.excise == Decimal("100.00")
+        assert breakdown.customs == Decimal("50.00")
+        assert breakdown.other == Decimal("25.00")
+        assert breakdown.total == Decimal("250.00")
+        assert [d.category for d in breakdown.details] == [
+            "VAT",
+            "EXCISE",
+            "CUSTOMS",
+            "WITHHOLDING",
+        ]
+
+    def test_cascading_taxes_compound(self):
+        """Test each cascading tax applies to the previously taxed amount."""
+        breakdown = TaxManager.calculate_cascading_tax(
+            100, [{"category": "EXCISE", "rate": 10}, {"category": "VAT", "rate": 7.5}]
+        )
+
+        assert breakdown.excise == Decimal("10.00")
+        assert breakdown.vat == Decimal("8.25")
+        assert breakdown.details[1].base_amount == Decimal("110.00")
+        assert breakdown.total == Decimal("18.25")
+
+    def test_multiple_taxes_compute_each_rate_once(self, monkeypatch):
+        """Test repeated rates on one base reuse the computed amount."""
+        from zutax.managers import tax_manager
+
+        calls = []
+        original = tax_manager._percent_of
+
+        def counting_percent_of(base, rate):
+            calls.append(rate)
+            return original(base, rate)
+
+        monkeypatch.setattr(tax_manager, "_percent_of", counting_percent_of)
+        taxes = [{"category": "VAT", "rate": 7.5}, {"category": "EXCISE", "rate": 10}] * 20
+
+        breakdown = TaxManager.calculate_multiple_taxes(100, taxes)
+
+        assert sorted(calls) == [7.5, 10]
+        assert breakdown.vat == Decimal("150.00")
+        assert breakdown.excise == Decimal("200.00")
+        assert len(breakdown.details) == 40
+
+    def test_calculations_have_model_types(self):
+        """Test unvalidated construction still yields float rates and Decimal amounts."""
+        calcs = [
+            TaxManager.calculate_line_tax(100, custom_rate=5),
+            TaxManager.apply_tax_holiday(100, 7.5, 0, True),
+            *TaxManager.calculate_multiple_taxes(100, [{"category": "VAT", "rate": 5}]).details,
+            *TaxManager.calculate_cascading_tax(100, [{"category": "VAT", "rate": Decimal("5")}]).details,
+        ]
+
+        for calc in calcs:
+            assert type(calc.rate) is float
+            assert isinstance(calc.base_amount, Decimal)
+            assert isinstance(calc.tax_amount, Decimal)
+        assert calcs[1].exemption_reason == "Tax holiday applied"
+        assert calcs[0].model_dump()["exemption_reason"] is None
+
+    def test_rate_conversions_are_cached(self):
+        """Test repeated rates reuse one Decimal conversion."""
+        from zutax.managers.tax_manager import _rate_decimal
+
+        _rate_decimal.cache_clear()
+        for amount in range(50):
+            TaxManager.calculate_withholding_tax(amount, 7.5)
+
+        info = _rate_decimal.cache_info()
+        assert info.misses == 1
+        assert info.hits == 49
+        assert _rate_decimal(7.5) == Decimal("7.5")
+
+    def test_empty_breakdown_is_zero(self):
+        """Test an empty tax list yields an all-zero breakdown."""
+        breakdown = TaxManager.calculate_multiple_taxes(100, [])
+
+        assert breakdown.model_dump() == {
+            "vat": Decimal(0),
+            "excise": Decimal(0),
+            "customs": Decimal(0),
+            "other": Decimal(0),
+            "total": Decimal(0),
+            "details": [],
+        }
+
+    def test_large_batch_stays_cent_exact(self):
+        """Test bulk breakdowns keep Decimal half-up rounding on every line."""
+        taxes = [{"category": "VAT", "rate": 7.5}, {"category": "EXCISE", "rate": 0.5}] * 2000
+
+        breakdown = TaxManager.calculate_multiple_taxes(3, taxes)
+
+        # 0.225 and 0.015 are ties that binary floats cannot round reliably
+        assert {d.tax_amount for d in breakdown.details} == {Decimal("0.23"), Decimal("0.02")}
+        assert breakdown.vat == Decimal("460.00")
+        assert breakdown.excise == Decimal("40.00")
+        assert breakdown.total == Decimal("500.00")
+
+    def test_breakdown_round_trips_as_model(self):
+        """Test constructed breakdowns serialize and re-validate like any model."""
+        from zutax.managers import TaxBreakdown
+
+        breakdown = TaxManager.calculate_multiple_taxes(
+            100, [{"category": "VAT", "rate": 7.5}, {"category": "OTHER", "rate": 1}]
+        )
+
+        assert TaxBreakdown.model_validate_json(breakdown.model_dump_json()) == breakdown
+
+    def test_tax_summary(self):
+        """Test the summary totals, per-category sums and effective rate."""
+        calcs = TaxManager.calculate_multiple_taxes(
+            200, [{"category": "VAT", "rate": 7.5}, {"category": "EXCISE", "rate": 5}]
+        ).details + [TaxManager.calculate_line_tax(100, custom_rate=7.5)]
+
+        summary = TaxManager.get_tax_summary(calcs)
+
+        assert summary["total_base"] == Decimal("500")
+        assert summary["total_tax"] == Decimal("32.50")
+        assert summary["categories"] == {"VAT": Decimal("22.50"), "EXCISE": Decimal("10.00")}
+        assert summary["effective_rate"] == 6.5
+        assert TaxManager.get_tax_summary([])["effective_rate"] == 0.0
@@ -13,6 +13,7 @@ from zutax.schemas.validators import (
     validate_hsn_code,
     validate_invoice_number,
     validate_business_id,
+    is_vat_exempt,
 )
 from zutax.models.enums import InvoiceType, UnitOfMeasure
 
@@ -186,6 +187,14 @@ class TestFieldValidators:
             assert is_valid is False
             assert error is not None
 
+    def test_is_vat_exempt(self):
+        """Test VAT exemption by exact code and chapter/heading prefix."""
+        assert is_vat_exempt("9018") is True  # exact heading
+        assert is_vat_exempt("30049099") is True  # chapter 30 prefix
+        assert is_vat_exempt("90181100") is True  # heading 9018 prefix
+        assert is_vat_exempt("8471") is False
+        assert is_vat_exempt("") is False
+
 
 class TestInvoiceValidation:
     """Test invoice-level validation."""
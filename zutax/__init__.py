@@ -5,6 +5,8 @@ implementation. This enables a clean rename without breaking internals
 in one step.
 """
 
+from typing import Any
+
 from .client import ZutaxClient  # noqa: F401
 from .processors import InvoiceProcessor, ProcessingResult  # noqa: F401
 
@@ -50,11 +52,6 @@ try:  # pragma: no cover
 except Exception:  # pragma: no cover
     ZutaxSigner = None  # type: ignore
 
-try:  # pragma: no cover
-    from .crypto.firs_qrcode import FIRSQRCodeGenerator  # type: ignore
-except Exception:  # pragma: no cover
-    FIRSQRCodeGenerator = None  # type: ignore
-
 try:  # pragma: no cover
     from .crypto.irn import IRNGenerator  # type: ignore
 except Exception:  # pragma: no cover
@@ -111,3 +108,16 @@ __all__ = [
     "InvoiceProcessor",
     "ProcessingResult",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # FIRSQRCodeGenerator pulls in qrcode and Pillow; resolve it on first
+    # access (PEP 562) so importing the SDK stays light
+    if name == "FIRSQRCodeGenerator":
+        try:
+            from .crypto.firs_qrcode import FIRSQRCodeGenerator as value
+        except Exception:  # pragma: no cover
+            value = None  # type: ignore
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,11 +1,21 @@
 """Zutax API client with retry logic and authentication (native)."""
 
+import asyncio
+import atexit
+import logging
+import math
+import threading
+import time
+import weakref
 from typing import Any, Dict, Optional
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-from ..config.settings import get_config
+from ..config.settings import ZutaxConfig, get_config
+from ..utils.serialization import loads
+
+logger = logging.getLogger(__name__)
 
 
 class APIResponse:
@@ -40,41 +50,97 @@ class APIError(Exception):
         self.response = response
 
 
+class TokenBucket:
+    """Token-bucket rate limiter for async callers.
+
+    Tokens refill continuously at ``rate_per_minute / 60`` per second up to
+    ``burst``. A caller that finds the bucket empty reserves its token anyway
+    and sleeps until it has refilled, so concurrent callers are spaced out in
+    arrival order. A caller cancelled while waiting hands its token back.
+    Reservation is guarded by a thread lock, so one bucket can be shared
+    across threads and event loops.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: Optional[int] = None) -> None:
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(burst or max(1, math.ceil(self.rate)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """Take ``tokens`` and return how long to wait before using them."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= tokens
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def _release(self, tokens: float) -> None:
+        """Return reserved ``tokens`` that will not be used."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+    async def acquire(self, tokens: float = 1) -> None:
+        delay = self._reserve(tokens)
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self._release(tokens)
+                raise
+
+
 class ZutaxAPIClient:
-    """API client with singleton pattern, retry logic and authentication."""
+    """API client with retry logic and authentication.
 
-    _instance = None
+    The SDK shares the module-level ``api_client`` instance; use
+    :meth:`instance` to reach it. Constructing the class directly creates an
+    independent client (e.g. for a different configuration).
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    ``requests.Session`` is not documented as thread-safe, so each thread
+    sends through its own session: ``session`` serves the thread that built
+    the client, and the worker threads behind ``aget``/``apost`` get one on
+    first use. All of them share one retrying ``HTTPAdapter`` (urllib3's
+    pool manager is thread-safe), so connections are still pooled.
+    """
 
-    def __init__(self) -> None:
-        if getattr(self, "_initialized", False):
-            return
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    RETRY_METHODS = frozenset(
+        {"HEAD", "GET", "POST", "PUT", "DELETE", "OPTIONS", "TRACE"}
+    )
+    # Sized for concurrent aget/apost fan-out from worker threads
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 32
 
-        self.config = get_config()
-        self.session = requests.Session()
+    def __init__(self, config: Optional[ZutaxConfig] = None) -> None:
+        self.config = config or get_config()
+        # Resolved once; request paths only join the endpoint onto these
+        self._base_url = self.config.base_url.rstrip("/")
+        self._timeout = self.config.timeout
+        rpm = self.config.rate_limit_rpm
+        self._rate_limiter: Optional[TokenBucket] = TokenBucket(rpm) if rpm else None
 
         retry_strategy = Retry(
             total=self.config.max_retries,
             backoff_factor=self.config.retry_delay / 1000.0,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=[
-                "HEAD",
-                "GET",
-                "POST",
-                "PUT",
-                "DELETE",
-                "OPTIONS",
-                "TRACE",
-            ],
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=self.RETRY_METHODS,
+        )
+        self._adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        # Live per-thread sessions, so header updates and close() reach them
+        self._sessions: "weakref.WeakSet[requests.Session]" = weakref.WeakSet()
+        self._sessions_lock = threading.Lock()
+        self._local = threading.local()
+        self.session = self._new_session()
+        self._local.session = self.session
 
         # Set default headers; ZutaxConfig stores api_key/secret as SecretStr
         def _secret(v: Any) -> str:
@@ -93,16 +159,55 @@ class ZutaxAPIClient:
             }
         )
 
-        self._initialized = True
+    def _new_session(
+        self, template: Optional[requests.Session] = None
+    ) -> requests.Session:
+        session = requests.Session()
+        session.mount("http://", self._adapter)
+        session.mount("https://", self._adapter)
+        with self._sessions_lock:
+            if template is not None:
+                # Copied under the lock so a concurrent update_headers is seen
+                session.headers = template.headers.copy()
+            self._sessions.add(session)
+        return session
+
+    def _thread_session(self) -> requests.Session:
+        """Return the calling thread's session, creating it on first use."""
+        session: Optional[requests.Session] = getattr(self._local, "session", None)
+        if session is None:
+            session = self._new_session(template=self.session)
+            self._local.session = session
+        return session
+
+    @classmethod
+    def instance(cls) -> "ZutaxAPIClient":
+        """Return the shared module-level client, creating it on first use."""
+        global api_client
+        if api_client is None:
+            api_client = cls()
+        return api_client
+
+    def close(self) -> None:
+        """Close every thread's session and release the pooled connections."""
+        with self._sessions_lock:
+            sessions = list(self._sessions)
+        for session in sessions:
+            session.close()
+
+    def __enter__(self) -> "ZutaxAPIClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
 
     def _full_url(self, endpoint: str) -> str:
-        return f"{self.config.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+        return f"{self._base_url}/{endpoint.lstrip('/')}"
 
-    def _handle_error(self, response: requests.Response) -> APIResponse:
-        try:
-            error_data = response.json()
-            message = error_data.get("message", f"HTTP {response.status_code}")
-        except Exception:
+    def _handle_error(self, response: requests.Response, payload: Any) -> APIResponse:
+        if isinstance(payload, dict):
+            message = payload.get("message", f"HTTP {response.status_code}")
+        else:
             message = f"HTTP {response.status_code} error"
         return APIResponse(
             success=False,
@@ -112,115 +217,110 @@ class ZutaxAPIClient:
         )
 
     def update_headers(self, headers: Dict[str, str]) -> None:
-        self.session.headers.update(headers)
+        with self._sessions_lock:
+            for session in self._sessions:
+                session.headers.update(headers)
 
     def set_auth_credentials(self, api_key: str, api_secret: str) -> None:
         self.update_headers({"x-api-key": api_key, "x-api-secret": api_secret})
 
-    # HTTP methods
-    def get(
-        self,
-        endpoint: str,
-        params: Optional[Dict[str, Any]] = None,
-        **kwargs,
-    ) -> APIResponse:
-        url = self._full_url(endpoint)
+    def _request(self, method: str, endpoint: str, **kwargs: Any) -> APIResponse:
+        """Send a request through this thread's retry-enabled session."""
+        url: str = self._full_url(endpoint)
         try:
-            response = self.session.get(
-                url, params=params, timeout=self.config.timeout, **kwargs
+            response: requests.Response = self._thread_session().request(
+                method, url, timeout=self._timeout, **kwargs
             )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s %s -> %s", method, url, response.status_code)
+            # Decode the body once; both the success and error paths use it
+            raw = response.content
+            try:
+                payload = loads(raw) if raw else None
+            except ValueError:
+                if response.status_code < 400:
+                    raise
+                payload = None
             if response.status_code >= 400:
-                return self._handle_error(response)
+                return self._handle_error(response, payload)
             return APIResponse(
                 success=True,
-                data=response.json() if response.content else None,
+                data=payload,
                 status_code=response.status_code,
             )
         except requests.exceptions.RequestException as e:  # pragma: no cover
+            logger.warning("%s %s failed: %s", method, url, e)
             return APIResponse(
                 success=False, error=str(e), message="Request failed"
             )
+        except ValueError as e:
+            logger.warning("%s %s returned invalid JSON: %s", method, url, e)
+            return APIResponse(
+                success=False, error=str(e), message="Invalid JSON response"
+            )
+
+    # HTTP methods
+    def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> APIResponse:
+        return self._request("GET", endpoint, params=params, **kwargs)
 
     def post(
         self,
         endpoint: str,
         data: Any = None,
         json: Any = None,
-        **kwargs,
+        **kwargs: Any,
     ) -> APIResponse:
-        url = self._full_url(endpoint)
-        try:
-            response = self.session.post(
-                url,
-                data=data,
-                json=json,
-                timeout=self.config.timeout,
-                **kwargs,
-            )
-            if response.status_code >= 400:
-                return self._handle_error(response)
-            return APIResponse(
-                success=True,
-                data=response.json() if response.content else None,
-                status_code=response.status_code,
-            )
-        except requests.exceptions.RequestException as e:  # pragma: no cover
-            return APIResponse(
-                success=False, error=str(e), message="Request failed"
-            )
+        return self._request("POST", endpoint, data=data, json=json, **kwargs)
 
     def put(
         self,
         endpoint: str,
         data: Any = None,
         json: Any = None,
-        **kwargs,
+        **kwargs: Any,
     ) -> APIResponse:
-        url = self._full_url(endpoint)
-        try:
-            response = self.session.put(
-                url,
-                data=data,
-                json=json,
-                timeout=self.config.timeout,
-                **kwargs,
-            )
-            if response.status_code >= 400:
-                return self._handle_error(response)
-            return APIResponse(
-                success=True,
-                data=response.json() if response.content else None,
-                status_code=response.status_code,
-            )
-        except requests.exceptions.RequestException as e:  # pragma: no cover
-            return APIResponse(
-                success=False, error=str(e), message="Request failed"
-            )
+        return self._request("PUT", endpoint, data=data, json=json, **kwargs)
 
-    def delete(self, endpoint: str, **kwargs) -> APIResponse:
-        url = self._full_url(endpoint)
-        try:
-            response = self.session.delete(
-                url, timeout=self.config.timeout, **kwargs
-            )
-            if response.status_code >= 400:
-                return self._handle_error(response)
-            return APIResponse(
-                success=True,
-                data=response.json() if response.content else None,
-                status_code=response.status_code,
-            )
-        except requests.exceptions.RequestException as e:  # pragma: no cover
-            return APIResponse(
-                success=False, error=str(e), message="Request failed"
-            )
+    def delete(self, endpoint: str, **kwargs: Any) -> APIResponse:
+        return self._request("DELETE", endpoint, **kwargs)
+
+    # Awaitable variants: run the blocking session call in a worker thread so
+    # concurrent callers (e.g. asyncio.gather) overlap their network I/O. They
+    # pass through the rate limiter first so fan-out backs off cooperatively.
+    async def aget(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> APIResponse:
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
+        return await asyncio.to_thread(self.get, endpoint, params, **kwargs)
+
+    async def apost(
+        self,
+        endpoint: str,
+        data: Any = None,
+        json: Any = None,
+        **kwargs: Any,
+    ) -> APIResponse:
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
+        return await asyncio.to_thread(self.post, endpoint, data, json, **kwargs)
 
 
-# Global singleton instance
+# Shared instance used by the SDK's API modules
 try:
     api_client = ZutaxAPIClient()
 except Exception:  # pragma: no cover
     api_client = None  # type: ignore
+else:
+    atexit.register(api_client.close)
 
 
-__all__ = ["ZutaxAPIClient", "APIResponse", "APIError", "api_client"]
+__all__ = ["ZutaxAPIClient", "APIResponse", "APIError", "TokenBucket", "api_client"]
@@ -1,11 +1,31 @@
 """Zutax Invoice API endpoints."""
 
+import asyncio
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel
 
-from .client import api_client
+from .client import ZutaxAPIClient
 from ..models.invoice import Invoice
 from ..schemas.validators_impl import InvoiceValidator  # type: ignore
+from ..utils.serialization import dumps
+
+
+# IRN-scoped endpoints; the IRN is appended per call
+_STATUS_PREFIX = "/api/v1/invoice/status/"
+_CANCEL_PREFIX = "/api/v1/invoice/cancel/"
+
+
+def _invoice_json(invoice: Invoice) -> bytes:
+    """Compact wire JSON for an invoice (model_dump_json indents by default)."""
+    return invoice.model_dump_json(indent=None).encode()
+
+
+def _encode_batch(invoices: List[Invoice]) -> bytes:
+    # Splice each invoice's JSON into the envelope instead of dumping to
+    # dicts and re-encoding the whole structure
+    return b'{"invoices":[' + b",".join(
+        _invoice_json(invoice) for invoice in invoices
+    ) + b"]}"
 
 
 class FIRSValidationResponse(BaseModel):
@@ -33,6 +53,9 @@ class InvoiceSubmissionResult(BaseModel):
 class InvoiceAPI:
     """Invoice API operations."""
 
+    # Max concurrent /batch-validate requests
+    BATCH_CONCURRENCY = 8
+
     @staticmethod
     def validate_local(invoice: Invoice) -> Dict[str, Any]:
         """Validate invoice locally using Pydantic schemas."""
@@ -51,8 +74,8 @@ class InvoiceAPI:
     @staticmethod
     async def validate_remote(invoice: Invoice) -> FIRSValidationResponse:
         """Validate invoice with FIRS API."""
-        response = api_client.post(  # type: ignore[attr-defined]
-            "/api/v1/invoice/validate", json=invoice.model_dump()
+        response = await ZutaxAPIClient.instance().apost(
+            "/api/v1/invoice/validate", data=_invoice_json(invoice)
         )
 
         if not response.success:  # type: ignore[union-attr]
@@ -82,9 +105,9 @@ class InvoiceAPI:
                 success=False, errors=local_validation["errors"]
             )
 
-        # Submit to FIRS
-        response = api_client.post(  # type: ignore[attr-defined]
-            "/api/v1/invoice/submit", json=invoice.model_dump(mode="json")
+        # Submit to FIRS (the session sends Content-Type: application/json)
+        response = await ZutaxAPIClient.instance().apost(
+            "/api/v1/invoice/submit", data=_invoice_json(invoice)
         )
 
         if not response.success:  # type: ignore[union-attr]
@@ -109,8 +132,8 @@ class InvoiceAPI:
     @staticmethod
     async def get_invoice_status(irn: str) -> Dict[str, Any]:
         """Get invoice status by IRN."""
-        response = api_client.get(  # type: ignore[attr-defined]
-            f"/api/v1/invoice/status/{irn}"
+        response = await ZutaxAPIClient.instance().aget(
+            _STATUS_PREFIX + irn
         )
 
         if not response.success:  # type: ignore[union-attr]
@@ -125,8 +148,8 @@ class InvoiceAPI:
     @staticmethod
     async def cancel_invoice(irn: str, reason: str) -> Dict[str, Any]:
         """Cancel an invoice."""
-        response = api_client.post(  # type: ignore[attr-defined]
-            f"/api/v1/invoice/cancel/{irn}", json={"reason": reason}
+        response = await ZutaxAPIClient.instance().apost(
+            _CANCEL_PREFIX + irn, data=dumps({"reason": reason})
         )
 
         if not response.success:  # type: ignore[union-attr]
@@ -142,10 +165,51 @@ class InvoiceAPI:
     async def batch_validate(
         invoices: List[Invoice],
     ) -> List[FIRSValidationResponse]:
-        """Batch validate multiple invoices."""
-        invoice_data = [invoice.model_dump() for invoice in invoices]
-        response = api_client.post(  # type: ignore[attr-defined]
-            "/api/v1/invoice/batch-validate", json={"invoices": invoice_data}
+        """Batch validate multiple invoices.
+
+        Invoices are sent in chunks of ``max_batch_size`` with at most
+        ``BATCH_CONCURRENCY`` requests in flight; results keep input order.
+        """
+        size = ZutaxAPIClient.instance().config.max_batch_size
+        chunks = [invoices[i : i + size] for i in range(0, len(invoices), size)]
+        semaphore = asyncio.Semaphore(InvoiceAPI.BATCH_CONCURRENCY)
+
+        async def validate_chunk(chunk: List[Invoice]) -> List[FIRSValidationResponse]:
+            async with semaphore:
+                return await InvoiceAPI._batch_validate_chunk(chunk)
+
+        responses = await asyncio.gather(
+            *(validate_chunk(chunk) for chunk in chunks), return_exceptions=True
+        )
+
+        results: List[FIRSValidationResponse] = []
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, BaseException):
+                # Only ordinary errors fail a chunk; cancellation propagates
+                if not isinstance(response, Exception):
+                    raise response
+                error = str(response)
+            elif len(response) != len(chunk):
+                error = (
+                    f"Batch validation returned {len(response)} results "
+                    f"for {len(chunk)} invoices"
+                )
+            else:
+                results.extend(response)
+                continue
+            results.extend(
+                FIRSValidationResponse(valid=False, errors=[error]) for _ in chunk
+            )
+        return results
+
+    @staticmethod
+    async def _batch_validate_chunk(
+        invoices: List[Invoice],
+    ) -> List[FIRSValidationResponse]:
+        # Encoding a chunk is CPU work; keep it off the event loop
+        body = await asyncio.to_thread(_encode_batch, invoices)
+        response = await ZutaxAPIClient.instance().apost(
+            "/api/v1/invoice/batch-validate", data=body
         )
 
         if not response.success:  # type: ignore[union-attr]
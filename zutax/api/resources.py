@@ -1,9 +1,60 @@
 """Zutax Resources API endpoints."""
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import functools
+import logging
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar, cast
 from pydantic import BaseModel
 
-from .client import api_client
+from .client import ZutaxAPIClient
+from ..cache.resource_cache import ResourceCache, resource_cache
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _replay_enabled() -> bool:
+    return os.environ.get("FIRS_RESOURCE_REPLAY", "").lower() in ("1", "true", "yes")
+
+
+def cached_resource(
+    prefix: str, model: Optional[type[BaseModel]] = None, ttl: float = 3600
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Serve a resource getter through ``resource_cache``.
+
+    The cache key is ``prefix`` plus any non-empty arguments (e.g.
+    ``lgas:LA``). Empty results are not cached, since getters return ``[]``
+    on request failures. Entries loaded from the cache's disk tier are plain
+    dicts; they were validated before being cached, so they are rebuilt as
+    ``model`` instances with ``model_construct``. With
+    ``FIRS_RESOURCE_REPLAY`` set, a cache miss raises ``LookupError``
+    instead of calling the API.
+    """
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            parts = [str(a) for a in args if a]
+            parts += [f"{k}={v}" for k, v in sorted(kwargs.items()) if v]
+            key = ResourceCache.create_key(prefix, *parts)
+            cached = resource_cache.get(key)
+            if cached is not None:
+                if model is not None and cached and isinstance(cached[0], dict):
+                    cached = [model.model_construct(**item) for item in cached]
+                    resource_cache.set(key, cached, ttl=resource_cache.get_ttl(key))
+                return cast(T, cached)
+            if _replay_enabled():
+                raise LookupError(f"Resource '{key}' is not cached (replay mode)")
+            value = await func(*args, **kwargs)
+            if value:
+                resource_cache.set(key, value, ttl=ttl)
+            return value
+
+        return wrapper
+
+    return decorator
 
 
 class VATExemption(BaseModel):
@@ -50,98 +101,141 @@ class TaxCategory(BaseModel):
 class ResourceAPI:
     """Resources API operations."""
 
+    # Max concurrent requests during preload_resources (None = unbounded)
+    PRELOAD_CONCURRENCY: Optional[int] = None
+
     @staticmethod
+    @cached_resource("vat_exemptions", VATExemption)
     async def get_vat_exemptions() -> List[VATExemption]:
-        response = api_client.get("/api/v1/invoice/resources/vat-exemptions")
+        response = await ZutaxAPIClient.instance().aget(
+            "/api/v1/invoice/resources/vat-exemptions"
+        )
         if not response.success:
-            print(f"Failed to get VAT exemptions: {response.error}")
+            logger.warning("Failed to get VAT exemptions: %s", response.error)
             return []
         data = response.data or []
         return [VATExemption(**item) for item in data]
 
     @staticmethod
+    @cached_resource("product_codes", ProductCode)
     async def get_product_codes() -> List[ProductCode]:
-        response = api_client.get("/api/v1/invoice/resources/product-codes")
+        response = await ZutaxAPIClient.instance().aget(
+            "/api/v1/invoice/resources/product-codes"
+        )
         if not response.success:
-            print(f"Failed to get product codes: {response.error}")
+            logger.warning("Failed to get product codes: %s", response.error)
             return []
         data = response.data or []
         return [ProductCode(**item) for item in data]
 
     @staticmethod
+    @cached_resource("service_codes", ServiceCode)
     async def get_service_codes() -> List[ServiceCode]:
-        response = api_client.get("/api/v1/invoice/resources/service-codes")
+        response = await ZutaxAPIClient.instance().aget(
+            "/api/v1/invoice/resources/service-codes"
+        )
         if not response.success:
-            print(f"Failed to get service codes: {response.error}")
+            logger.warning("Failed to get service codes: %s", response.error)
             return []
         data = response.data or []
         return [ServiceCode(**item) for item in data]
 
     @staticmethod
+    @cached_resource("states", State)
     async def get_states() -> List[State]:
-        response = api_client.get("/api/v1/invoice/resources/states")
+        response = await ZutaxAPIClient.instance().aget(
+            "/api/v1/invoice/resources/states"
+        )
         if not response.success:
-            print(f"Failed to get states: {response.error}")
+            logger.warning("Failed to get states: %s", response.error)
             return []
         data = response.data or []
         return [State(**item) for item in data]
 
     @staticmethod
+    @cached_resource("lgas", LGA)
     async def get_lgas(state_code: Optional[str] = None) -> List[LGA]:
         endpoint = "/api/v1/invoice/resources/lgas"
         if state_code:
             endpoint += f"?state_code={state_code}"
-        response = api_client.get(endpoint)
+        response = await ZutaxAPIClient.instance().aget(endpoint)
         if not response.success:
-            print(f"Failed to get LGAs: {response.error}")
+            logger.warning("Failed to get LGAs: %s", response.error)
             return []
         data = response.data or []
         return [LGA(**item) for item in data]
 
     @staticmethod
+    @cached_resource("invoice_types", InvoiceType)
     async def get_invoice_types() -> List[InvoiceType]:
-        response = api_client.get("/api/v1/invoice/resources/invoice-types")
+        response = await ZutaxAPIClient.instance().aget(
+            "/api/v1/invoice/resources/invoice-types"
+        )
         if not response.success:
-            print(f"Failed to get invoice types: {response.error}")
+            logger.warning("Failed to get invoice types: %s", response.error)
             return []
         data = response.data or []
         return [InvoiceType(**item) for item in data]
 
     @staticmethod
+    @cached_resource("tax_categories", TaxCategory)
     async def get_tax_categories() -> List[TaxCategory]:
-        response = api_client.get("/api/v1/invoice/resources/tax-categories")
+        response = await ZutaxAPIClient.instance().aget(
+            "/api/v1/invoice/resources/tax-categories"
+        )
         if not response.success:
-            print(f"Failed to get tax categories: {response.error}")
+            logger.warning("Failed to get tax categories: %s", response.error)
             return []
         data = response.data or []
         return [TaxCategory(**item) for item in data]
 
     @staticmethod
     async def preload_resources() -> Dict[str, Any]:
-        from ..cache.resource_cache import resource_cache
-
+        """Warm the resource cache by fetching every resource.
+
+        The getters cache their own results, so this only has to call them.
+        """
+        # Independent lookups: issue them together so total latency is the
+        # slowest call rather than the sum of all of them.
+        fetchers = {
+            "vat_exemptions": ResourceAPI.get_vat_exemptions,
+            "product_codes": ResourceAPI.get_product_codes,
+            "service_codes": ResourceAPI.get_service_codes,
+            "states": ResourceAPI.get_states,
+            "lgas": ResourceAPI.get_lgas,
+            "invoice_types": ResourceAPI.get_invoice_types,
+            "tax_categories": ResourceAPI.get_tax_categories,
+        }
+        limit = ResourceAPI.PRELOAD_CONCURRENCY
+        semaphore = asyncio.Semaphore(limit) if limit else None
+
+        async def fetch(getter: Callable[[], Awaitable[Any]]) -> Any:
+            if semaphore is None:
+                return await getter()
+            async with semaphore:
+                return await getter()
+
+        outcomes = await asyncio.gather(
+            *(fetch(getter) for getter in fetchers.values()),
+            return_exceptions=True,
+        )
+
+        # One failing resource must not discard the others
         results: Dict[str, Any] = {}
-        try:
-            results["vat_exemptions"] = await ResourceAPI.get_vat_exemptions()
-            results["product_codes"] = await ResourceAPI.get_product_codes()
-            results["service_codes"] = await ResourceAPI.get_service_codes()
-            results["states"] = await ResourceAPI.get_states()
-            results["lgas"] = await ResourceAPI.get_lgas()
-            results["invoice_types"] = await ResourceAPI.get_invoice_types()
-            results["tax_categories"] = await ResourceAPI.get_tax_categories()
-
-            for key, value in results.items():
-                resource_cache.set(key, value, ttl=3600)
-
-            print("✓ All resources preloaded successfully")
-        except Exception as e:  # pragma: no cover - defensive
-            print(f"Failed to preload resources: {e}")
-
+        for key, outcome in zip(fetchers, outcomes):
+            if isinstance(outcome, BaseException):
+                # Only ordinary errors skip a resource; cancellation propagates
+                if not isinstance(outcome, Exception):
+                    raise outcome
+                logger.warning("Failed to preload %s: %s", key, outcome)
+                continue
+            results[key] = outcome
+
+        if len(results) == len(fetchers):
+            logger.info("All resources preloaded successfully")
         return results
 
     @staticmethod
     async def refresh_all_resources() -> Dict[str, Any]:
-        from ..cache.resource_cache import resource_cache
-
         resource_cache.clear()
         return await ResourceAPI.preload_resources()
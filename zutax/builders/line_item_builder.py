@@ -1,13 +1,45 @@
 """Line item builder with fluent interface (Zutax)."""
 
-from typing import Optional, List, Union
+from typing import Any, Dict, Iterable, Optional, List, Union
 from decimal import Decimal
+from pydantic import TypeAdapter
 from ..models import LineItem, Discount, Charge, UnitOfMeasure, TaxCategory
+from ..schemas.validators import is_vat_exempt
+from ..utils.decimals import ZERO, to_decimal
+
+# Fields copied verbatim by LineItemBuilder.from_dict
+_BASIC_FIELDS = (
+    "item_id",
+    "line_number",
+    "description",
+    "hsn_code",
+    "product_code",
+    "barcode",
+    "quantity",
+    "unit_price",
+)
+_TAX_FIELDS = ("tax_rate", "tax_exempt", "tax_exempt_reason")
+_MISSING = object()
+
+_DEFAULT_TAX_RATE = Decimal("7.5")
+
+# Validates a whole list of charge dicts in one core-validator call
+_CHARGES_ADAPTER = TypeAdapter(List[Charge])
+
+# Fields that must be set (and non-empty) before build(), in check order
+_REQUIRED_FIELDS = (
+    ("description", "Item description is required"),
+    ("hsn_code", "HSN/SAC code is required"),
+    ("quantity", "Quantity is required"),
+)
 
 
 class LineItemBuilder:
     """Fluent builder for creating LineItem with Pydantic validation."""
 
+    # Builders are created per line item in bulk flows; no per-instance dict
+    __slots__ = ("_item_data", "_charges")
+
     def __init__(self):
         """Initialize line item builder."""
         self._item_data = {}
@@ -16,7 +48,7 @@ class LineItemBuilder:
         # Set defaults
         self._item_data["unit_of_measure"] = UnitOfMeasure.UNIT
         self._item_data["tax_category"] = TaxCategory.VAT
-        self._item_data["tax_rate"] = Decimal("7.5")
+        self._item_data["tax_rate"] = _DEFAULT_TAX_RATE
         self._item_data["tax_exempt"] = False
 
     def with_item_id(self, item_id: str) -> "LineItemBuilder":
@@ -44,8 +76,6 @@ class LineItemBuilder:
         self._item_data["hsn_code"] = hsn_code
 
         # Auto-detect VAT exemption based on HSN code
-        from ..schemas.validators import is_vat_exempt
-
         if is_vat_exempt(hsn_code):
             self._item_data["tax_exempt"] = True
             self._item_data["tax_exempt_reason"] = "HSN code is VAT exempt"
@@ -84,7 +114,7 @@ class LineItemBuilder:
             quantity: Quantity value
             unit_of_measure: Optional unit of measure
         """
-        self._item_data["quantity"] = Decimal(str(quantity))
+        self._item_data["quantity"] = to_decimal(quantity)
 
         if unit_of_measure:
             if isinstance(unit_of_measure, str):
@@ -97,7 +127,7 @@ class LineItemBuilder:
         self, unit_price: Union[Decimal, float]
     ) -> "LineItemBuilder":
         """Set unit price before tax."""
-        self._item_data["unit_price"] = Decimal(str(unit_price))
+        self._item_data["unit_price"] = to_decimal(unit_price)
         return self
 
     def with_discount_percent(
@@ -109,7 +139,7 @@ class LineItemBuilder:
         Args:
             percent: Discount percentage (0-100)
         """
-        percent_decimal = Decimal(str(percent))
+        percent_decimal = to_decimal(percent)
         self._item_data["discount_percent"] = percent_decimal
 
         # Also set the discount object for compatibility
@@ -130,7 +160,7 @@ class LineItemBuilder:
             description: Optional discount description
         """
         discount = Discount(
-            amount=Decimal(str(amount)),
+            amount=to_decimal(amount),
             description=description or "Fixed discount",
         )
         self._item_data["discount"] = discount
@@ -159,7 +189,7 @@ class LineItemBuilder:
             tax_category = TaxCategory(tax_category.upper())
 
         charge = Charge(
-            amount=Decimal(str(amount)),
+            amount=to_decimal(amount),
             description=description,
             tax_category=tax_category,
         )
@@ -194,7 +224,7 @@ class LineItemBuilder:
             tax_rate: Tax rate percentage
             tax_category: Optional tax category
         """
-        self._item_data["tax_rate"] = Decimal(str(tax_rate))
+        self._item_data["tax_rate"] = to_decimal(tax_rate)
 
         if tax_category:
             if isinstance(tax_category, str):
@@ -213,7 +243,7 @@ class LineItemBuilder:
         self._item_data["tax_exempt"] = True
         self._item_data["tax_exempt_reason"] = reason
         self._item_data["tax_exemption_reason"] = reason  # alias
-        self._item_data["tax_rate"] = Decimal("0")
+        self._item_data["tax_rate"] = ZERO
         return self
 
     def with_notes(self, notes: str) -> "LineItemBuilder":
@@ -221,12 +251,22 @@ class LineItemBuilder:
         self._item_data["notes"] = notes
         return self
 
+    def with_fields(self, **fields: Any) -> "LineItemBuilder":
+        """
+        Set several fields at once.
+
+        Values are stored as given (no Decimal/enum coercion or HSN
+        exemption detection); LineItem validation still runs on build().
+        """
+        self._item_data.update(fields)
+        return self
+
     def reset(self) -> "LineItemBuilder":
         """Reset builder to initial state."""
         self._item_data = {
             "unit_of_measure": UnitOfMeasure.UNIT,
             "tax_category": TaxCategory.VAT,
-            "tax_rate": Decimal("7.5"),
+            "tax_rate": _DEFAULT_TAX_RATE,
             "tax_exempt": False,
         }
         self._charges = []
@@ -239,27 +279,21 @@ class LineItemBuilder:
         Returns:
             True if valid, raises ValueError if not
         """
-        if not self._item_data.get("description"):
-            raise ValueError("Item description is required")
-
-        if not self._item_data.get("hsn_code"):
-            raise ValueError("HSN/SAC code is required")
+        data = self._item_data
+        for field, message in _REQUIRED_FIELDS:
+            if not data.get(field):
+                raise ValueError(message)
 
-        if not self._item_data.get("quantity"):
-            raise ValueError("Quantity is required")
-
-        if self._item_data.get("quantity", 0) <= 0:
+        if data["quantity"] <= 0:
             raise ValueError("Quantity must be greater than zero")
 
-        if "unit_price" not in self._item_data:
+        unit_price = data.get("unit_price")
+        if unit_price is None:
             raise ValueError("Unit price is required")
-
-        if self._item_data.get("unit_price", 0) < 0:
+        if unit_price < 0:
             raise ValueError("Unit price cannot be negative")
 
-        if self._item_data.get("tax_exempt") and not self._item_data.get(
-            "tax_exempt_reason"
-        ):
+        if data.get("tax_exempt") and not data.get("tax_exempt_reason"):
             raise ValueError("Tax exemption reason required when tax exempt")
 
         return True
@@ -281,8 +315,9 @@ class LineItemBuilder:
         if self._charges:
             self._item_data["charges"] = self._charges
 
-        # Create and return LineItem with Pydantic validation
-        return LineItem(**self._item_data)
+        # Validate the collected dict directly with the model's compiled
+        # validator rather than unpacking it into LineItem.__init__
+        return LineItem.model_validate(self._item_data)
 
     def build_dict(self) -> dict:
         """
@@ -304,6 +339,20 @@ class LineItemBuilder:
         item = self.build()
         return item.model_dump_json(exclude_none=True, by_alias=True)
 
+    @staticmethod
+    def bulk_build(rows: Iterable[Dict[str, Any]]) -> List[LineItem]:
+        """
+        Validate many line items straight from dictionaries.
+
+        Skips the builder entirely; LineItem supplies the same defaults the
+        builder would (unit, VAT category, 7.5% rate).
+
+        Raises:
+            ValidationError: If any row fails Pydantic validation
+        """
+        validate = LineItem.model_validate
+        return [validate(row) for row in rows]
+
     @classmethod
     def from_dict(cls, data: dict) -> "LineItemBuilder":
         """
@@ -316,43 +365,33 @@ class LineItemBuilder:
             LineItemBuilder instance with data
         """
         builder = cls()
+        item_data = builder._item_data
 
-        # Set basic fields
-        for field in [
-            "item_id",
-            "line_number",
-            "description",
-            "hsn_code",
-            "product_code",
-            "barcode",
-            "quantity",
-            "unit_price",
-        ]:
-            if field in data:
-                builder._item_data[field] = data[field]
+        # Set basic fields (one lookup per field)
+        for field in _BASIC_FIELDS:
+            value = data.get(field, _MISSING)
+            if value is not _MISSING:
+                item_data[field] = value
 
         # Set enums
         if "unit_of_measure" in data:
-            builder._item_data["unit_of_measure"] = UnitOfMeasure(
-                data["unit_of_measure"]
-            )
+            item_data["unit_of_measure"] = UnitOfMeasure(data["unit_of_measure"])
 
         if "tax_category" in data:
-            builder._item_data["tax_category"] = TaxCategory(
-                data["tax_category"]
-            )
+            item_data["tax_category"] = TaxCategory(data["tax_category"])
 
         # Set tax fields
-        for field in ["tax_rate", "tax_exempt", "tax_exempt_reason"]:
-            if field in data:
-                builder._item_data[field] = data[field]
+        for field in _TAX_FIELDS:
+            value = data.get(field, _MISSING)
+            if value is not _MISSING:
+                item_data[field] = value
 
         # Set discount
-        if "discount" in data:
-            builder._item_data["discount"] = Discount(**data["discount"])
+        if discount := data.get("discount"):
+            item_data["discount"] = Discount(**discount)
 
         # Set charges
-        if "charges" in data:
-            builder._charges = [Charge(**charge) for charge in data["charges"]]
+        if charges := data.get("charges"):
+            builder._charges = _CHARGES_ADAPTER.validate_python(charges)
 
         return builder
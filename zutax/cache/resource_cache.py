@@ -1,80 +1,256 @@
 """Resource caching implementation for API responses (Zutax)."""
 
+import asyncio
+import hashlib
+import heapq
+import logging
+import os
+import sys
 import time
 import threading
-from typing import Any, Dict, List, Optional, Callable, Awaitable
-from pydantic import BaseModel
+from pathlib import Path
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
 
-from ..config.settings import get_config
+from ..config.settings import ZutaxConfig, get_config
+from ..utils.formatting import safe_filename
+from ..utils.serialization import dumps, loads
 
+logger = logging.getLogger(__name__)
 
-class CacheEntry(BaseModel):
-    data: Any
-    timestamp: float
-    ttl: float
+# File suffix of disk tier entries
+_DISK_SUFFIX = ".zcache.json"
 
 
-class ResourceCache:
-    """Thread-safe resource cache for API responses."""
+@dataclass(slots=True)
+class CacheEntry:
+    """Cached value with its absolute expiry time (``time.monotonic()`` based)."""
 
-    _instance = None
-    _lock = threading.Lock()
+    data: Any
+    expiry: float
 
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
 
-    def __init__(self):
-        if self._initialized:
-            return
+class ResourceCache:
+    """Thread-safe resource cache for API responses.
+
+    Each instance is independent; the SDK shares the one returned by
+    ``get_resource_cache()``.
+    """
 
+    def __init__(self) -> None:
+        self.config: Optional[ZutaxConfig]
         try:
             self.config = get_config()
             self.default_ttl = getattr(self.config, "cache_ttl", 300)
         except Exception:  # pragma: no cover
             self.config = None
             self.default_ttl = 300
-        self._cache: Dict[str, CacheEntry] = {}
+        # Optional L2 tier: entries are also written as JSON files so a new
+        # process can start warm, and processes pointed at the same directory
+        # (e.g. server workers) share one copy. Values come back as plain
+        # JSON data. Disk I/O never happens under the lock.
+        cache_dir = getattr(self.config, "cache_dir", None)
+        self.disk_path: Optional[Path] = Path(cache_dir) if cache_dir else None
+        # Least recently used first; bounded by maxsize
+        self.maxsize: int = getattr(self.config, "cache_maxsize", None) or 10000
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        # (expiry, key) min-heap; entries go stale when a key is re-set
+        self._expiry_heap: List[Tuple[float, str]] = []
+        # key -> result future of the get_or_set factory call in progress
+        self._inflight: Dict[str, asyncio.Future] = {}
         self._stats = {"hits": 0, "misses": 0, "sets": 0, "deletes": 0}
+        # Running estimate of cached bytes, maintained on insert/remove
+        self._approx_bytes = 0
         self._lock = threading.RLock()
-        self._initialized = True
 
     def _is_expired(self, entry: CacheEntry) -> bool:
-        return time.time() - entry.timestamp > entry.ttl
+        return entry.expiry < time.monotonic()
+
+    @staticmethod
+    def _entry_size(key: str, entry: CacheEntry) -> int:
+        # Shallow size: containers are counted, not the objects they hold
+        return sys.getsizeof(entry.data) + len(key)
 
-    def _cleanup_expired(self) -> None:
-        current_time = time.time()
-        expired_keys = []
-        for key, entry in self._cache.items():
-            if current_time - entry.timestamp > entry.ttl:
-                expired_keys.append(key)
-        for key in expired_keys:
-            del self._cache[key]
+    def _discard(self, key: str) -> None:
+        """Remove ``key`` and its size contribution (caller holds the lock)."""
+        entry = self._cache.pop(key)
+        self._approx_bytes -= self._entry_size(key, entry)
 
-    def get(self, key: str) -> Any:
-        with self._lock:
-            self._cleanup_expired()
-            if key in self._cache:
-                entry = self._cache[key]
-                if not self._is_expired(entry):
-                    self._stats["hits"] += 1
-                    return entry.data
-                del self._cache[key]
-            self._stats["misses"] += 1
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        """Insert ``entry`` and schedule its expiry (caller holds the lock)."""
+        cache = self._cache
+        previous = cache.get(key)
+        if previous is not None:
+            self._approx_bytes -= self._entry_size(key, previous)
+            cache.move_to_end(key)
+        cache[key] = entry
+        self._approx_bytes += self._entry_size(key, entry)
+        self._trim()
+        heapq.heappush(self._expiry_heap, (entry.expiry, key))
+        self._compact_heap()
+
+    def _store_many(self, items: List[Tuple[str, CacheEntry]]) -> None:
+        """Batch form of ``_store``: one size update, trim and heap rebuild."""
+        cache = self._cache
+        entry_size = self._entry_size
+        delta = 0
+        for key, entry in items:
+            previous = cache.get(key)
+            if previous is not None:
+                delta -= entry_size(key, previous)
+                cache.move_to_end(key)
+            cache[key] = entry
+            delta += entry_size(key, entry)
+        self._approx_bytes += delta
+        self._trim()
+        heap = self._expiry_heap
+        if len(items) >= len(heap):
+            # Cheaper to heapify once than to push each item
+            heap.extend((entry.expiry, key) for key, entry in items)
+            heapq.heapify(heap)
+        else:
+            for key, entry in items:
+                heapq.heappush(heap, (entry.expiry, key))
+        self._compact_heap()
+
+    def _trim(self) -> None:
+        """Evict least recently used entries beyond ``maxsize``."""
+        cache = self._cache
+        while len(cache) > self.maxsize:
+            old_key, old_entry = cache.popitem(last=False)
+            self._approx_bytes -= self._entry_size(old_key, old_entry)
+
+    def _compact_heap(self) -> None:
+        # Re-set keys leave stale heap items behind; rebuild when they dominate
+        heap = self._expiry_heap
+        if len(heap) > 2 * len(self._cache) + 64:
+            heap[:] = [(e.expiry, k) for k, e in self._cache.items()]
+            heapq.heapify(heap)
+
+    def _touch(self, keys: Iterable[str]) -> None:
+        """Mark ``keys`` most recently used.
+
+        Skipped when another thread holds the lock: reordering must not race
+        a locked iteration, and an occasionally stale order is harmless.
+        """
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            for key in keys:
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+        finally:
+            self._lock.release()
+
+    def _evict_some(self, limit: Optional[int] = 32, now: Optional[float] = None) -> None:
+        """Drop up to ``limit`` expired entries (all when ``None``).
+
+        Pops the soonest-expiring heap items, so the work is bounded by the
+        number of expired keys rather than the cache size.
+        """
+        heap = self._expiry_heap
+        if now is None:
+            now = time.monotonic()
+        evicted = 0
+        while heap and heap[0][0] < now and (limit is None or evicted < limit):
+            expiry, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Skip stale items whose key was re-set with a later expiry
+            if entry is not None and entry.expiry == expiry:
+                self._discard(key)
+                evicted += 1
+
+    def _disk_file(self, key: str) -> Path:
+        # safe_filename alone is lossy ("a:b" and "a_b" collide), so the name
+        # is keyed on a digest of the key; the short prefix is for humans.
+        # The suffix marks the files clear() may delete in a shared directory.
+        digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        name = f"{safe_filename(key)[:48]}.{digest}{_DISK_SUFFIX}"
+        return self.disk_path / name  # type: ignore[operator]
+
+    def _write_disk(self, key: str, value: Any, expires: float) -> None:
+        # Monotonic time is per process; the file stores wall-clock expiry
+        wall_expires = time.time() + (expires - time.monotonic())
+        path = self._disk_file(key)
+        # Other processes may share this directory: write a private temp file
+        # and rename it into place so readers never see a partial entry
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.disk_path.mkdir(parents=True, exist_ok=True)  # type: ignore[union-attr]
+            tmp.write_bytes(dumps({"v": value, "exp": wall_expires}))
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError) as e:  # best effort
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Cache disk write failed for %s: %s", key, e)
+            try:
+                tmp.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def _read_disk(self, key: str) -> Optional[CacheEntry]:
+        path = self._disk_file(key)
+        try:
+            record = loads(path.read_bytes())
+        except (OSError, ValueError):
             return None
+        remaining = record.get("exp", 0) - time.time()
+        if remaining <= 0:
+            path.unlink(missing_ok=True)
+            return None
+        return CacheEntry(record["v"], time.monotonic() + remaining)
+
+    def _load_slow(self, key: str, stale: Optional[CacheEntry]) -> Optional[CacheEntry]:
+        """Miss path: drop ``stale`` and fall back to the disk tier."""
+        if stale is not None:
+            with self._lock:
+                # Only delete the entry we saw; another thread may have re-set it
+                if self._cache.get(key) is stale:
+                    self._discard(key)
+        if self.disk_path is None:
+            return None
+        entry = self._read_disk(key)
+        if entry is None:
+            return None
+        with self._lock:
+            current = self._cache.get(key)
+            # A set() that landed while the file was read wins over the file
+            if current is not None and current.expiry >= time.monotonic():
+                return current
+            self._store(key, entry)
+        return entry
+
+    # Reads do not take the lock: a single dict.get is atomic under the GIL
+    # and entries are replaced, never mutated in place, by writers (except
+    # update_ttl's expiry bump). Stats counters are approximate under
+    # concurrent access.
+    def get(self, key: str) -> Any:
+        entry = self._cache.get(key)
+        if entry is None or entry.expiry < time.monotonic():
+            if entry is None and self.disk_path is None:
+                self._stats["misses"] += 1
+                return None
+            entry = self._load_slow(key, entry)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+        self._stats["hits"] += 1
+        self._touch((key,))
+        return entry.data
 
     def set(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
         try:
             with self._lock:
                 ttl = ttl or self.default_ttl
-                entry = CacheEntry(data=value, timestamp=time.time(), ttl=ttl)
-                self._cache[key] = entry
+                now = time.monotonic()
+                entry = CacheEntry(value, now + ttl)
+                self._store(key, entry)
+                self._evict_some(now=now)
                 self._stats["sets"] += 1
-                return True
+            if self.disk_path is not None:
+                self._write_disk(key, value, entry.expiry)
+            return True
         except Exception:
             return False
 
@@ -84,36 +260,67 @@ class ResourceCache:
         factory: Callable[[], Awaitable[Any]],
         ttl: Optional[float] = None,
     ) -> Any:
+        """Return the cached value or compute it with ``factory``.
+
+        Concurrent callers for the same missing key share one ``factory``
+        call: the first runs it and the rest await its result.
+        """
         cached_value = self.get(key)
         if cached_value is not None:
             return cached_value
-        fresh_value = await factory()
-        self.set(key, fresh_value, ttl)
-        return fresh_value
+
+        loop = asyncio.get_running_loop()
+        pending = self._inflight.get(key)
+        if pending is not None and pending.get_loop() is loop:
+            # shield: a cancelled waiter must not cancel the shared result
+            return await asyncio.shield(pending)
+
+        future = loop.create_future()
+        self._inflight[key] = future
+        try:
+            fresh_value = await factory()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # retrieved; avoid the "never retrieved" log
+            raise
+        else:
+            self.set(key, fresh_value, ttl)
+            future.set_result(fresh_value)
+            return fresh_value
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
 
     def has(self, key: str) -> bool:
-        with self._lock:
-            if key in self._cache:
-                entry = self._cache[key]
-                if not self._is_expired(entry):
-                    return True
-                del self._cache[key]
+        entry = self._cache.get(key)
+        if entry is not None and entry.expiry >= time.monotonic():
+            return True
+        if entry is None and self.disk_path is None:
             return False
+        return self._load_slow(key, entry) is not None
 
     def delete(self, key: str) -> bool:
+        if self.disk_path is not None:
+            self._disk_file(key).unlink(missing_ok=True)
         with self._lock:
             if key in self._cache:
-                del self._cache[key]
+                self._discard(key)
                 self._stats["deletes"] += 1
                 return True
             return False
 
     def delete_many(self, keys: List[str]) -> int:
         deleted_count = 0
+        if self.disk_path is not None:
+            for key in keys:
+                self._disk_file(key).unlink(missing_ok=True)
         with self._lock:
             for key in keys:
                 if key in self._cache:
-                    del self._cache[key]
+                    self._discard(key)
                     deleted_count += 1
             self._stats["deletes"] += deleted_count
             return deleted_count
@@ -121,11 +328,17 @@ class ResourceCache:
     def clear(self) -> None:
         with self._lock:
             self._cache.clear()
+            self._approx_bytes = 0
+            self._expiry_heap.clear()
+        # Only this cache's files: the directory may hold other JSON data
+        if self.disk_path is not None and self.disk_path.is_dir():
+            for path in self.disk_path.glob(f"*{_DISK_SUFFIX}"):
+                path.unlink(missing_ok=True)
 
     def get_stats(self) -> Dict[str, Any]:
         with self._lock:
-            self._cleanup_expired()
-            hit_rate = 0
+            self._evict_some(limit=None)
+            hit_rate = 0.0
             total_requests = self._stats["hits"] + self._stats["misses"]
             if total_requests > 0:
                 hit_rate = (self._stats["hits"] / total_requests) * 100
@@ -134,65 +347,75 @@ class ResourceCache:
                 "hits": self._stats["hits"],
                 "misses": self._stats["misses"],
                 "hit_rate": round(hit_rate, 2),
-                "size": len(str(self._cache)),
+                "size": self._approx_bytes,
             }
 
     def get_keys(self) -> List[str]:
         with self._lock:
-            self._cleanup_expired()
+            self._evict_some(limit=None)
             return list(self._cache.keys())
 
     def update_ttl(self, key: str, ttl: float) -> bool:
         with self._lock:
             if key in self._cache:
-                self._cache[key].ttl = ttl
-                self._cache[key].timestamp = time.time()
+                entry = self._cache[key]
+                entry.expiry = time.monotonic() + ttl
+                self._store(key, entry)
                 return True
             return False
 
     def get_ttl(self, key: str) -> Optional[float]:
-        with self._lock:
-            if key in self._cache:
-                entry = self._cache[key]
-                remaining = entry.ttl - (time.time() - entry.timestamp)
-                return max(0, remaining)
+        entry = self._cache.get(key)
+        if entry is None:
             return None
+        return max(0, entry.expiry - time.monotonic())
 
     def get_many(self, keys: List[str]) -> Dict[str, Any]:
         result: Dict[str, Any] = {}
-        with self._lock:
-            self._cleanup_expired()
-            for key in keys:
-                if key in self._cache:
-                    entry = self._cache[key]
-                    if not self._is_expired(entry):
-                        result[key] = entry.data
-                        self._stats["hits"] += 1
-                    else:
-                        del self._cache[key]
-                        self._stats["misses"] += 1
-                else:
-                    self._stats["misses"] += 1
+        now = time.monotonic()
+        cache = self._cache
+        on_disk = self.disk_path is not None
+        for key in keys:
+            entry = cache.get(key)
+            if entry is None or entry.expiry < now:
+                # Same miss path as get(): fall back to the disk tier
+                if entry is None and not on_disk:
+                    continue
+                entry = self._load_slow(key, entry)
+                if entry is None:
+                    continue
+            result[key] = entry.data
+        hits = len(result)
+        if hits:
+            self._touch(result)
+        self._stats["hits"] += hits
+        self._stats["misses"] += len(keys) - hits
         return result
 
     def set_many(self, entries: List[Dict[str, Any]]) -> bool:
         try:
             with self._lock:
-                for entry in entries:
-                    key = entry["key"]
-                    value = entry["value"]
-                    ttl = entry.get("ttl", self.default_ttl)
-                    self._cache[key] = CacheEntry(
-                        data=value, timestamp=time.time(), ttl=ttl
-                    )
-                    self._stats["sets"] += 1
-                return True
+                now = time.monotonic()
+                default_ttl = self.default_ttl
+                items = [
+                    (entry["key"], CacheEntry(entry["value"], now + entry.get("ttl", default_ttl)))
+                    for entry in entries
+                ]
+                self._store_many(items)
+                self._stats["sets"] += len(items)
+                self._evict_some(now=now)
+            if self.disk_path is not None:
+                for key, cached in items:
+                    self._write_disk(key, cached.data, cached.expiry)
+            return True
         except Exception:  # pragma: no cover
             return False
 
     @staticmethod
     def create_key(*parts: str) -> str:
-        return ":".join(parts)
+        # Interned: equal keys share one object (and its cached hash), so
+        # dict lookups short-circuit on identity instead of comparing text
+        return sys.intern(":".join(parts))
 
     KEY_PREFIXES = {
         "VAT_EXEMPTIONS": "vat_exemptions",
@@ -206,6 +429,12 @@ class ResourceCache:
     }
 
 
-resource_cache = ResourceCache()
+@lru_cache(maxsize=1)
+def get_resource_cache() -> ResourceCache:
+    """Return the process-wide resource cache."""
+    return ResourceCache()
+
+
+resource_cache = get_resource_cache()
 
-__all__ = ["ResourceCache", "CacheEntry", "resource_cache"]
+__all__ = ["ResourceCache", "CacheEntry", "get_resource_cache", "resource_cache"]
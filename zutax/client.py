@@ -4,7 +4,7 @@ Implements key client operations expected by tests:
 - initialization with config or overrides
 - create builders
 - local validation
-- submit invoice (async) using requests.post
+- submit invoice (async) through the shared API client session
 - generate IRN with same formatting as legacy
 - save invoice to file
 - get invoice status (async)
@@ -14,6 +14,7 @@ Note: We intentionally mirror return shapes used by tests.
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -29,8 +30,12 @@ from .config.settings import (
 from .builders import InvoiceBuilder, LineItemBuilder
 from .models.invoice import Invoice
 from .models.enums import InvoiceStatus
-from .api.client import api_client
+from .api.client import ZutaxAPIClient
 from .api.invoice import InvoiceAPI, FIRSValidationResponse
+from .crypto.irn import IRNGenerator
+from .schemas.validators_impl import InvoiceValidator
+from .utils.formatting import safe_filename
+from .utils.serialization import dumps
 
 
 class InvoiceSubmissionResult(BaseModel):
@@ -74,24 +79,23 @@ class ZutaxClient:
 
         # Initialize API layer
         self.invoice_api = InvoiceAPI()
+        self._irn_generator = IRNGenerator(config=self.config)
+        self._qr_generator: Optional[Any] = None
         
-        # Update API client credentials if provided
+        # Resolve credentials once; SecretStr is only dereferenced here
         try:
-            api_key = (
-                self.config.api_key.get_secret_value()
-                if hasattr(self.config.api_key, "get_secret_value")
-                else str(self.config.api_key)
+            self.set_auth_credentials(
+                self._get_secret(self.config.api_key),
+                self._get_secret(self.config.api_secret),
             )
-            api_secret = (
-                self.config.api_secret.get_secret_value()
-                if hasattr(self.config.api_secret, "get_secret_value")
-                else str(self.config.api_secret)
-            )
-            api_client.set_auth_credentials(api_key, api_secret)
         except Exception:
             # Ignore in tests
             pass
 
+    def set_auth_credentials(self, api_key: str, api_secret: str) -> None:
+        """Set the credentials the shared API client sends with each request."""
+        ZutaxAPIClient.instance().set_auth_credentials(api_key, api_secret)
+
     # Builders
     def create_invoice_builder(
         self, business_context: Optional[BusinessContext] = None
@@ -109,16 +113,39 @@ class ZutaxClient:
         
         For remote validation, use validate_invoice_async.
         """
-        try:
-            invoice_data = invoice.model_dump()
-            Invoice.model_validate(invoice_data)
-            return FIRSValidationResponse(valid=True, errors=[], warnings=[])
-        except Exception as e:
-            return FIRSValidationResponse(
-                valid=False,
-                errors=[str(e)],
-                warnings=[],
+        return self._to_validation_response(
+            InvoiceValidator.validate_invoice(invoice)
+        )
+
+    async def batch_validate_invoices(
+        self, invoices: List[Invoice]
+    ) -> List[FIRSValidationResponse]:
+        """Validate many invoices locally, in input order.
+
+        Uses the same validator as validate_invoice, run in a worker thread
+        so a large batch does not block the event loop.
+        """
+        return await asyncio.to_thread(self._validate_batch, invoices)
+
+    def _validate_batch(
+        self, invoices: List[Invoice]
+    ) -> List[FIRSValidationResponse]:
+        return [self.validate_invoice(invoice) for invoice in invoices]
+
+    @staticmethod
+    def _to_validation_response(
+        result: Dict[str, Any]
+    ) -> FIRSValidationResponse:
+        if result["valid"]:
+            # Built entirely by the SDK, so skip re-validation
+            return FIRSValidationResponse.model_construct(
+                valid=True, errors=[], warnings=[]
             )
+        return FIRSValidationResponse(
+            valid=False,
+            errors=result["errors"],
+            warnings=result["warnings"],
+        )
     
     async def validate_invoice_async(self, invoice: Invoice, remote: bool = True) -> FIRSValidationResponse:
         """Validate invoice locally and optionally with FIRS API.
@@ -163,8 +190,10 @@ class ZutaxClient:
         # Delegate actual submission to API layer
         api_result = await self.invoice_api.submit_invoice(invoice)
         
-        # Convert API result to client result format for backward compatibility
-        return InvoiceSubmissionResult(
+        # Convert API result to client result format for backward compatibility.
+        # api_result was validated when InvoiceAPI built it and every other
+        # value is produced here, so model_construct skips a redundant pass.
+        return InvoiceSubmissionResult.model_construct(
             success=api_result.success,
             irn=api_result.irn or invoice.irn,
             invoice_number=invoice.invoice_number,
@@ -180,9 +209,7 @@ class ZutaxClient:
         """Generate IRN using standard FIRS formatting.
         Format: {InvoiceNumber}-{ServiceID}-{DateStamp}
         """
-        from .crypto.irn import IRNGenerator
-        generator = IRNGenerator(config=self.config)
-        return generator.generate_irn(invoice)
+        return self._irn_generator.generate_irn(invoice)
 
     # File ops
     def save_invoice_to_file(
@@ -191,17 +218,55 @@ class ZutaxClient:
         if not output_path:
             output_path = (
                 Path(self.config.output_dir)
-                / f"invoice_{invoice.invoice_number}.json"
+                / f"invoice_{safe_filename(invoice.invoice_number)}.json"
             )
         else:
             output_path = Path(output_path)
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(
-            invoice.model_dump_json(indent=2, exclude_none=True)
+        # Encoded bytes go straight to disk; no intermediate str copy
+        output_path.write_bytes(
+            dumps(invoice.model_dump(exclude_none=True), indent=True)
         )
         return str(output_path)
 
+    async def save_invoices_to_files(
+        self, invoices: List[Invoice], output_dir: Optional[str] = None
+    ) -> List[str]:
+        """Save many invoices as ``invoice_<number>.json`` files.
+
+        The target directory is created once and the writes run
+        concurrently in worker threads. Invoices that would share a file
+        name (e.g. ``INV/001`` and ``INV_001``) raise ``ValueError``
+        before anything is written.
+        """
+        directory = Path(output_dir or self.config.output_dir)
+        paths = [
+            directory / f"invoice_{safe_filename(invoice.invoice_number)}.json"
+            for invoice in invoices
+        ]
+        seen: Dict[Path, str] = {}
+        for invoice, path in zip(invoices, paths):
+            if path in seen:
+                raise ValueError(
+                    f"Invoices {seen[path]!r} and {invoice.invoice_number!r} "
+                    f"would both be saved as {path.name}"
+                )
+            seen[path] = invoice.invoice_number
+        directory.mkdir(parents=True, exist_ok=True)
+
+        def _write(invoice: Invoice, path: Path) -> str:
+            path.write_bytes(
+                dumps(invoice.model_dump(exclude_none=True), indent=True)
+            )
+            return str(path)
+
+        return list(
+            await asyncio.gather(
+                *(asyncio.to_thread(_write, inv, path) for inv, path in zip(invoices, paths))
+            )
+        )
+
     # Status
     async def get_invoice_status(self, irn: str) -> Dict[str, Any]:
         """Get invoice status by IRN.
@@ -247,9 +312,11 @@ class ZutaxClient:
                 if hasattr(qr_options, key):
                     setattr(qr_options, key, value)
 
-        generator = FIRSQRCodeGenerator(config=self.config)   
+        # Reuse one generator so its signer (and parsed keys) persist
+        if self._qr_generator is None:
+            self._qr_generator = FIRSQRCodeGenerator(config=self.config)
         try:
-            return generator.generate_qr_code(irn, qr_options)
+            return self._qr_generator.generate_qr_code(irn, qr_options)
         except Exception as e:
             raise RuntimeError(f"Failed to generate QR code: {e}")
 
@@ -118,14 +118,6 @@ class ZutaxConfig(BaseSettings):
         None, description="FIRS-assigned Service ID (8 characters)"
     )
 
-    firs_certificate: Optional[str] = Field(
-        None, description="FIRS certificate (Base64-encoded)"
-    )
-    
-    firs_public_key: Optional[str] = Field(
-        None, description="FIRS public key (Base64-encoded PEM)"
-    )
-
     # Operational Settings
     timeout: int = Field(
         default=DEFAULT_TIMEOUT, ge=5, le=120,
@@ -139,10 +131,25 @@ class ZutaxConfig(BaseSettings):
         default=1000, ge=100, le=10000,
         description="Retry delay in milliseconds",
     )
+    rate_limit_rpm: Optional[int] = Field(
+        default=None, ge=0,
+        description="Max async API requests per minute (unset, empty or 0 disables)",
+    )
     cache_ttl: int = Field(
         default=DEFAULT_CACHE_TTL, ge=0,
         description="Cache TTL in seconds",
     )
+    cache_maxsize: int = Field(
+        default=10000, ge=1,
+        description="Max in-memory resource cache entries (LRU eviction)",
+    )
+    cache_dir: Optional[str] = Field(
+        default=None,
+        description=(
+            "Directory persisting the resource cache across restarts"
+            " and sharing it between processes"
+        ),
+    )
     verify_ssl: bool = Field(
         default=True, description="Verify SSL certificates"
     )
@@ -230,6 +237,14 @@ class ZutaxConfig(BaseSettings):
         path.mkdir(parents=True, exist_ok=True)
         return str(path.absolute())
 
+    @field_validator("rate_limit_rpm", mode="before")
+    @classmethod
+    def empty_rate_limit_disables(cls, v: Any) -> Any:
+        # FIRS_RATE_LIMIT_RPM= (or "none") in the environment turns it off
+        if isinstance(v, str) and v.strip().lower() in ("", "none"):
+            return None
+        return v
+
     @field_validator("private_key_path", "certificate_path")
     @classmethod
     def validate_file_path(cls, v: Optional[str]) -> Optional[str]:
@@ -1,7 +1,42 @@
 """Zutax crypto package.
 
 Submodules provide proxies to legacy implementations where needed without
-importing heavy dependencies at package import time.
+importing heavy dependencies at package import time. Public names are
+resolved on first access (PEP 562).
 """
 
-__all__ = []
+from importlib import import_module
+from typing import Any, List
+
+_SIGN_NAMES = frozenset(
+    {
+        "FIRSSigner",
+        "FIRSSigningPayload",
+        "FIRSSigningResult",
+        "FIRSEncryptionResult",
+        "get_firs_signer",
+    }
+)
+_QR_NAMES = frozenset({"FIRSQRCodeGenerator", "FIRSQRCodeOptions"})
+_IRN_NAMES = frozenset({"IRNGenerator"})
+
+__all__ = sorted(_SIGN_NAMES | _QR_NAMES | _IRN_NAMES)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SIGN_NAMES:
+        module = import_module(".firs_signing", __name__)
+    elif name in _QR_NAMES:
+        module = import_module(".firs_qrcode", __name__)
+    elif name in _IRN_NAMES:
+        module = import_module(".irn", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(module, name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,6 +1,7 @@
 """FIRS QR code generation utilities (Zutax native)."""
 
 import base64
+import binascii
 import io
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -10,6 +11,23 @@ from pydantic import BaseModel
 from qrcode.image.pil import PilImage
 
 from .irn import IRNGenerator
+from ..utils.formatting import safe_filename
+
+
+# QR images are two-colour and small: fast zlib costs a few bytes but most
+# of the encode time, and the optimize pass buys nothing
+_PNG_SAVE_OPTIONS: Dict[str, Any] = {
+    "format": "PNG",
+    "compress_level": 1,
+    "optimize": False,
+}
+
+_ERROR_CORRECTION_MAP = {
+    "L": qrcode.constants.ERROR_CORRECT_L,
+    "M": qrcode.constants.ERROR_CORRECT_M,
+    "Q": qrcode.constants.ERROR_CORRECT_Q,
+    "H": qrcode.constants.ERROR_CORRECT_H,
+}
 
 
 class FIRSQRCodeOptions(BaseModel):
@@ -32,6 +50,7 @@ class FIRSQRCodeGenerator:
     def __init__(self, config: Optional[Any] = None):
         """Initialize with optional config."""
         self.config = config
+        self._firs_signer: Optional[Any] = None
 
     def generate_qr_code(
         self,
@@ -42,25 +61,15 @@ class FIRSQRCodeGenerator:
         if options is None:
             options = FIRSQRCodeOptions()
 
-        # Import signer lazily to avoid heavy dependency at import time
-        from .firs_signing import FIRSSigner  # noqa: WPS433
-
-        signer = FIRSSigner(config=self.config)
-        if not signer.is_configured():
-            raise Exception(
-                "FIRS keys not configured. Cannot generate QR code."
-            )
-
         # Sign the IRN to get encrypted data
-        signing_result = signer.sign_irn(irn)
-        qr_data = signing_result.encrypted_data
+        qr_data = self._encrypted_irn(irn)
 
         # Generate QR code
         qr_code = self._create_qr_code(qr_data, options)
 
         # Convert to base64 PNG
         img_buffer = io.BytesIO()
-        qr_code.save(img_buffer, format="PNG")
+        qr_code.save(img_buffer, **_PNG_SAVE_OPTIONS)
         img_buffer.seek(0)
 
         img_base64 = base64.b64encode(img_buffer.getvalue()).decode("utf-8")
@@ -77,18 +86,8 @@ class FIRSQRCodeGenerator:
         if options is None:
             options = FIRSQRCodeOptions()
 
-        # Import signer lazily to avoid heavy dependency at import time
-        from .firs_signing import FIRSSigner  # noqa: WPS433
-
-        signer = FIRSSigner(config=self.config)
-        if not signer.is_configured():
-            raise Exception(
-                "FIRS keys not configured. Cannot generate QR code."
-            )
-
         # Sign the IRN to get encrypted data
-        signing_result = signer.sign_irn(irn)
-        qr_data = signing_result.encrypted_data
+        qr_data = self._encrypted_irn(irn)
 
         # Generate QR code
         qr_code = self._create_qr_code(qr_data, options)
@@ -97,7 +96,7 @@ class FIRSQRCodeGenerator:
         Path(file_path).parent.mkdir(parents=True, exist_ok=True)
 
         # Save to file
-        qr_code.save(file_path, format="PNG")
+        qr_code.save(file_path, **_PNG_SAVE_OPTIONS)
 
     def _create_qr_code(
         self,
@@ -105,78 +104,108 @@ class FIRSQRCodeGenerator:
         options: FIRSQRCodeOptions,
     ) -> PilImage:
         """Create QR code image from data."""
-        # Map error correction levels
-        error_correction_map = {
-            "L": qrcode.constants.ERROR_CORRECT_L,
-            "M": qrcode.constants.ERROR_CORRECT_M,
-            "Q": qrcode.constants.ERROR_CORRECT_Q,
-            "H": qrcode.constants.ERROR_CORRECT_H,
-        }
+        return self._render_qr_code(self._new_qr_code(options), data, options)
 
-        error_correction = error_correction_map.get(
+    @staticmethod
+    def _new_qr_code(options: FIRSQRCodeOptions) -> qrcode.QRCode:
+        """Create a QRCode configured from options (reusable via clear())."""
+        error_correction = _ERROR_CORRECTION_MAP.get(
             options.error_correction,
             qrcode.constants.ERROR_CORRECT_M,
         )
-
-        # Create QR code with settings
-        qr = qrcode.QRCode(
+        return qrcode.QRCode(
             version=options.version,
             error_correction=error_correction,
             box_size=options.box_size,
             border=options.border,
         )
 
+    @staticmethod
+    def _render_qr_code(
+        qr: qrcode.QRCode,
+        data: str,
+        options: FIRSQRCodeOptions,
+    ) -> PilImage:
+        """Render ``data`` with a (possibly reused) QRCode."""
+        qr.clear()
+        # Fitting only grows the version; restart from the configured one
+        qr.version = options.version
         qr.add_data(data)
         qr.make(fit=True)
 
         # Create image with provided colors (match legacy defaults)
-        img = qr.make_image(
+        return qr.make_image(
             fill_color=options.fill_color,
             back_color=options.back_color,
         )
-        return img
+
+    def _signer(self) -> Any:
+        """Return a signer loaded with the FIRS keys, built once per generator."""
+        if self._firs_signer is not None:
+            return self._firs_signer
+
+        # Import signer lazily to avoid heavy dependency at import time
+        from .firs_signing import FIRSSigner, get_firs_signer  # noqa: WPS433
+
+        signer = (
+            get_firs_signer()
+            if self.config is None
+            else FIRSSigner(config=self.config)
+        )
+        if not signer.is_configured():
+            raise Exception(
+                "FIRS keys not configured. Cannot generate QR code."
+            )
+        self._firs_signer = signer
+        return signer
+
+    def _encrypted_irn(self, irn: str) -> str:
+        """Sign the IRN and return the encrypted QR payload."""
+        encrypted: str = self._signer().sign_irn(irn).encrypted_data
+        return encrypted
 
     def generate_multiple_qr_codes(
         self,
         invoices: List[Any],
         output_dir: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        """Generate QR codes for multiple invoices."""
-        results: List[Dict[str, Any]] = []
+        """Generate QR codes for multiple invoices, in input order.
 
+        The signer, QRCode and PNG buffer are set up once and reused for
+        every invoice in the batch.
+        """
         if output_dir:
             Path(output_dir).mkdir(parents=True, exist_ok=True)
 
-        for i, invoice in enumerate(invoices):
+        irns = self._batch_irns(invoices)
+        pngs = self._render_batch(irns)
+
+        results: List[Dict[str, Any]] = []
+        for i, (invoice, irn, png) in enumerate(zip(invoices, irns, pngs)):
             try:
-                # Generate IRN if not present
-                if not getattr(invoice, "irn", None):
-                    irn_generator = IRNGenerator(config=self.config)
-                    irn = irn_generator.generate_irn(invoice)
-                else:
-                    irn = invoice.irn
+                if isinstance(png, Exception):
+                    raise png
 
                 if output_dir:
-                    output_path = Path(output_dir) / f"qr_{irn}_{i + 1}.png"
-                    self.generate_qr_code_to_file(
-                        invoice,
-                        irn,
-                        str(output_path),
+                    output_path = (
+                        Path(output_dir) / f"qr_{safe_filename(irn)}_{i + 1}.png"
+                    )
+                    output_path.write_bytes(png)
+                    results.append(
+                        {
+                            "irn": irn,
+                            "file_path": str(output_path),
+                            "success": True,
+                        }
                     )
-                    result: Dict[str, Any] = {
-                        "irn": irn,
-                        "file_path": str(output_path),
-                        "success": True,
-                    }
                 else:
-                    qr_base64 = self.generate_qr_code(irn)
-                    result = {
-                        "irn": irn,
-                        "qr_code": qr_base64,
-                        "success": True,
-                    }
-
-                results.append(result)
+                    results.append(
+                        {
+                            "irn": irn,
+                            "qr_code": base64.b64encode(png).decode("utf-8"),
+                            "success": True,
+                        }
+                    )
 
             except Exception as error:  # noqa: BLE001
                 results.append(
@@ -189,13 +218,53 @@ class FIRSQRCodeGenerator:
 
         return results
 
+    def _batch_irns(self, invoices: List[Any]) -> List[Any]:
+        """Return each invoice's IRN (generated if missing) or its error."""
+        irn_generator: Optional[IRNGenerator] = None
+        irns: List[Any] = []
+        for invoice in invoices:
+            irn = getattr(invoice, "irn", None)
+            if not irn:
+                try:
+                    if irn_generator is None:
+                        irn_generator = IRNGenerator(config=self.config)
+                    irn = irn_generator.generate_irn(invoice)
+                except Exception as error:  # noqa: BLE001
+                    irn = error
+            irns.append(irn)
+        return irns
+
+    def _render_batch(self, irns: List[Any]) -> List[Any]:
+        """Render PNGs, reusing one QRCode and buffer."""
+        options = FIRSQRCodeOptions()
+        qr = self._new_qr_code(options)
+        img_buffer = io.BytesIO()
+        pngs: List[Any] = []
+        for irn in irns:
+            if isinstance(irn, Exception):
+                pngs.append(irn)
+                continue
+            try:
+                qr_image = self._render_qr_code(
+                    qr, self._encrypted_irn(irn), options
+                )
+                img_buffer.seek(0)
+                img_buffer.truncate()
+                qr_image.save(img_buffer, **_PNG_SAVE_OPTIONS)
+                pngs.append(img_buffer.getvalue())
+            except Exception as error:  # noqa: BLE001
+                pngs.append(error)
+        return pngs
+
     @staticmethod
     def validate_qr_data(qr_data: str) -> bool:
         """Validate QR code data format (base64)."""
         try:
-            base64.b64decode(qr_data)
+            # Strict decode rejects non-alphabet characters in the same pass
+            # instead of silently discarding them
+            base64.b64decode(qr_data, validate=True)
             return True
-        except Exception:  # noqa: BLE001
+        except (binascii.Error, ValueError, TypeError):
             return False
 
     @staticmethod
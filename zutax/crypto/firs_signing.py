@@ -10,11 +10,52 @@ import os
 import json
 import time
 import base64
+import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 from pydantic import BaseModel
 
+logger = logging.getLogger(__name__)
+
+
+def _import_crypto() -> Tuple[Any, Any]:
+    """Import Crypto only when needed to avoid import-time errors."""
+    try:
+        from Crypto.PublicKey import RSA  # type: ignore
+        from Crypto.Cipher import PKCS1_v1_5  # type: ignore
+    except Exception as exc:  # noqa: BLE001
+        raise RuntimeError(
+            "pycryptodome (Crypto) is required for signing operations"
+        ) from exc
+    return RSA, PKCS1_v1_5
+
+
+@lru_cache(maxsize=8)
+def _cipher_for_pem(public_key_pem: str) -> Any:
+    """Parse a PEM public key and build its PKCS#1 v1.5 cipher, once per key."""
+    RSA, PKCS1_v1_5 = _import_crypto()
+    return PKCS1_v1_5.new(RSA.import_key(public_key_pem))
+
+
+def _json_safe(value: str) -> bool:
+    """True if ``value`` needs no escaping inside a JSON string."""
+    return value.isascii() and value.isprintable() and '"' not in value and "\\" not in value
+
+
+def _payload_json(irn: str, certificate: str) -> bytes:
+    """Encode the signing payload as compact JSON.
+
+    IRNs and base64 certificates never need escaping, so the fixed two-key
+    object is assembled directly; anything else goes through the model's
+    serializer.
+    """
+    if _json_safe(irn) and _json_safe(certificate):
+        return b'{"irn":"' + irn.encode() + b'","certificate":"' + certificate.encode() + b'"}'
+    payload = FIRSSigningPayload.model_construct(irn=irn, certificate=certificate)
+    return payload.__pydantic_serializer__.to_json(payload)
+
 
 class FIRSSigningPayload(BaseModel):
     """FIRS signing payload structure."""
@@ -22,6 +63,10 @@ class FIRSSigningPayload(BaseModel):
     irn: str
     certificate: str
 
+    def to_json_bytes(self) -> bytes:
+        """Encode as compact JSON (same bytes as the core serializer)."""
+        return _payload_json(self.irn, self.certificate)
+
 
 class FIRSEncryptionResult(BaseModel):
     """FIRS encryption result."""
@@ -50,14 +95,7 @@ class FIRSSigner:
 
     def _ensure_crypto(self):  # pragma: no cover - trivial import helper
         """Import Crypto only when needed to avoid import-time errors."""
-        try:
-            from Crypto.PublicKey import RSA  # type: ignore
-            from Crypto.Cipher import PKCS1_v1_5  # type: ignore
-        except Exception as exc:  # noqa: BLE001
-            raise RuntimeError(
-                "pycryptodome (Crypto) is required for signing operations"
-            ) from exc
-        return RSA, PKCS1_v1_5
+        return _import_crypto()
 
     def _load_firs_keys(self) -> None:
         """Load FIRS public key and certificate from config, env or key file."""
@@ -150,23 +188,17 @@ class FIRSSigner:
                 " encryption"
             )
 
-        RSA, PKCS1_v1_5 = self._ensure_crypto()
+        # Log the IRN only: the certificate must never reach logs or stdout
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Encrypting FIRS payload irn=%s", payload.irn)
 
         try:
-            payload_reduced = {
-                "irn": payload.irn,
-                "certificate": payload.certificate,
-            }
-
-            rsa_key = RSA.import_key(self.firs_public_key_pem)
-            cipher = PKCS1_v1_5.new(rsa_key)
-
-            data_bytes_reduced = json.dumps(payload_reduced).encode("utf-8")
-            encrypted_data_reduced = cipher.encrypt(data_bytes_reduced)
-
-            encrypted_base64 = base64.b64encode(encrypted_data_reduced).decode(
-                "utf-8"
+            # Key parsing and cipher setup happen once per public key; every
+            # call encrypts afresh so PKCS#1 v1.5 padding stays randomized
+            encrypted = _cipher_for_pem(self.firs_public_key_pem).encrypt(
+                _payload_json(payload.irn, payload.certificate)
             )
+            encrypted_base64 = base64.b64encode(encrypted).decode("utf-8")
 
             return FIRSEncryptionResult(
                 encrypted_base64=encrypted_base64,
@@ -199,16 +231,10 @@ class FIRSSigner:
     decode public key (base64 PEM or raw PEM), RSA-PKCS1 v1_5 encrypt,
     base64.
         """
-        RSA, PKCS1_v1_5 = FIRSSigner()._ensure_crypto()
         try:
             timestamp = int(time.time())
             irn_with_timestamp = f"{irn}.{timestamp}"
 
-            payload_reduced = {
-                "irn": irn_with_timestamp,
-                "certificate": certificate,
-            }
-
             if "-----BEGIN PUBLIC KEY-----" in public_key_input:
                 public_key_pem = public_key_input
             else:
@@ -216,10 +242,11 @@ class FIRSSigner:
                     "utf-8"
                 )
 
-            rsa_key = RSA.import_key(public_key_pem)
-            cipher = PKCS1_v1_5.new(rsa_key)
+            cipher = _cipher_for_pem(public_key_pem)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Encrypting QR payload irn=%s", irn_with_timestamp)
 
-            data_bytes_reduced = json.dumps(payload_reduced).encode("utf-8")
+            data_bytes_reduced = _payload_json(irn_with_timestamp, certificate)
             encrypted_data_reduced = cipher.encrypt(data_bytes_reduced)
 
             encrypted_b64_reduced = base64.b64encode(
@@ -267,3 +294,13 @@ class FIRSSigner:
             "encrypted_data": encryption_result.encrypted_base64,
             "qr_code_ready": len(encryption_result.encrypted_base64) > 0,
         }
+
+
+@lru_cache(maxsize=1)
+def get_firs_signer() -> FIRSSigner:
+    """Return a shared signer loaded from the environment or key file.
+
+    Call ``get_firs_signer.cache_clear()`` after changing the FIRS key
+    environment variables.
+    """
+    return FIRSSigner()
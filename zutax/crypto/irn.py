@@ -7,14 +7,66 @@ validation and parsing. This replaces the legacy proxy.
 from __future__ import annotations
 
 import os
+import re
+import time
 import uuid
 from datetime import datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Optional, Dict, Any
 
 if TYPE_CHECKING:  # pragma: no cover - for type hints only
     from ..models.invoice import Invoice
 
 
+def _normalize_service_id(service_id: str) -> str:
+    """Return the 8-character, upper-case form of a service ID."""
+    return service_id[:8].upper()
+
+
+def _fmt_date(year: int, month: int, day: int) -> str:
+    """Return the YYYYMMDD stamp."""
+    return f"{year:04d}{month:02d}{day:02d}"
+
+
+# (tm_year, tm_yday) -> YYYYMMDD for the current local day
+_today_stamp: tuple[tuple[int, int], str] = ((-1, -1), "")
+
+
+def _today_date_stamp() -> str:
+    """Return today's YYYYMMDD stamp, formatting it once per day."""
+    global _today_stamp
+    now = time.localtime()
+    key = (now.tm_year, now.tm_yday)
+    if _today_stamp[0] != key:
+        _today_stamp = (key, _fmt_date(now.tm_year, now.tm_mon, now.tm_mday))
+    return _today_stamp[1]
+
+
+# {InvoiceNumber}-{ServiceID}-{DateStamp}; the greedy head leaves the last
+# two dash-separated fields to the ID and stamp
+_IRN_RE = re.compile(r"(.+)-([A-Za-z0-9]{8})-(\d{8})", re.ASCII)
+
+
+@lru_cache(maxsize=256)
+def _parse_irn(irn: str) -> Optional[tuple[str, str, str, tuple[int, int, int]]]:
+    """Split and check an IRN, or return None if it is malformed.
+
+    Returns (invoice_number, service_id, date_stamp, (year, month, day)).
+    Cached so validate_irn followed by extract_components parses once.
+    """
+    match = _IRN_RE.fullmatch(irn)
+    if match is None:
+        return None
+    invoice_number, service_id, date_stamp = match.groups()
+    # The stamp is 8 ASCII digits: slice it instead of strptime
+    ymd = (int(date_stamp[:4]), int(date_stamp[4:6]), int(date_stamp[6:]))
+    try:
+        datetime(*ymd)
+    except ValueError:
+        return None
+    return invoice_number, service_id, date_stamp, ymd
+
+
 class IRNGenerator:
     """Generates FIRS-compliant Invoice Reference Numbers (IRN).
 
@@ -55,19 +107,19 @@ class IRNGenerator:
         issue_date = getattr(invoice, "issue_date", None)
         date_stamp = self._generate_date_stamp(issue_date)
 
-        return f"{invoice_number}-{service_id}-{date_stamp}"
+        return f"{invoice_number}-{_normalize_service_id(service_id)}-{date_stamp}"
 
     @staticmethod
     def _generate_service_id() -> str:
         """Generate 8-character service ID using UUID4 base."""
-        uuid_str = str(uuid.uuid4()).replace("-", "").upper()
-        return uuid_str[:8]
+        return uuid.uuid4().hex[:8].upper()
 
     @staticmethod
     def _generate_date_stamp(issue_date: Optional[datetime] = None) -> str:
         """Generate date stamp in YYYYMMDD format."""
-        dt = issue_date or datetime.now()
-        return dt.strftime("%Y%m%d")
+        if issue_date is None:
+            return _today_date_stamp()
+        return _fmt_date(issue_date.year, issue_date.month, issue_date.day)
 
     @staticmethod
     def validate_irn(irn: str) -> bool:
@@ -75,48 +127,23 @@ class IRNGenerator:
         Format: {InvoiceNumber}-{ServiceID}-{DateStamp}
         Note: InvoiceNumber may contain dashes.
         """
-        if not irn:
-            return False
-
-        parts = irn.split("-")
-        if len(parts) < 3:
-            return False
-
-        date_stamp = parts[-1]
-        service_id = parts[-2]
-        invoice_number = "-".join(parts[:-2])
-
-        if not invoice_number:
-            return False
-        if len(service_id) != 8 or not service_id.isalnum():
-            return False
-        if len(date_stamp) != 8 or not date_stamp.isdigit():
-            return False
-        try:
-            datetime.strptime(date_stamp, "%Y%m%d")
-        except ValueError:
-            return False
-        return True
+        return bool(irn) and _parse_irn(irn) is not None
 
     @staticmethod
     def extract_components(irn: str) -> Dict[str, object]:
         """Extract components from IRN as a dict.
         Raises ValueError if the IRN is invalid.
         """
-        if not IRNGenerator.validate_irn(irn):
+        parsed = _parse_irn(irn) if irn else None
+        if parsed is None:
             raise ValueError("Invalid IRN format")
 
-        parts = irn.split("-")
-        date_stamp = parts[-1]
-        service_id = parts[-2]
-        invoice_number = "-".join(parts[:-2])
-        issue_date = datetime.strptime(date_stamp, "%Y%m%d")
-
+        invoice_number, service_id, date_stamp, (year, month, day) = parsed
         return {
             "invoice_number": invoice_number,
             "service_id": service_id,
             "date_stamp": date_stamp,
-            "issue_date": issue_date,
+            "issue_date": datetime(year, month, day),
         }
 
     @staticmethod
@@ -126,7 +153,9 @@ class IRNGenerator:
         issue_date: Optional[datetime] = None,
     ) -> str:
         """Create custom IRN with specific components."""
-        sid = (service_id or IRNGenerator._generate_service_id())[:8].upper()
+        sid = _normalize_service_id(
+            service_id or IRNGenerator._generate_service_id()
+        )
         ds = IRNGenerator._generate_date_stamp(issue_date)
         irn = f"{invoice_number}-{sid}-{ds}"
         if not IRNGenerator.validate_irn(irn):
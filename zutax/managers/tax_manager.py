@@ -1,16 +1,65 @@
 """Tax calculation and management utilities (Zutax)."""
 
-from decimal import Decimal, ROUND_HALF_UP
-from typing import Dict, List, Optional, Any
+from decimal import Context, Decimal, ROUND_HALF_UP
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Union
 from pydantic import BaseModel
 
 from .hsn_manager import HSNManager
 from ..config.constants import DEFAULT_CONFIG, TAX_CATEGORIES
 from ..models.tax import Tax
+from ..utils.decimals import ZERO, HUNDRED, CENT, to_decimal
+
+# Rounding context for amounts; Context.quantize skips the thread-local
+# context lookup and the rounding= keyword on every call
+_CTX = Context(prec=28, rounding=ROUND_HALF_UP)
+
+# Category for single-rate VAT lines, looked up once at import
+_STD_VAT = TAX_CATEGORIES["STANDARD_VAT"]
+
+# Category codes per TaxBreakdown bucket; anything else counts as "other"
+_VAT_CATS = frozenset(
+    {
+        _STD_VAT,
+        TAX_CATEGORIES["REDUCED_VAT"],
+        TAX_CATEGORIES["ZERO_VAT"],
+    }
+)
+_EXCISE_CATS = frozenset(
+    {
+        TAX_CATEGORIES["ALCOHOL_EXCISE_TAX"],
+        TAX_CATEGORIES["TOBACCO_EXCISE_TAX"],
+        TAX_CATEGORIES["FUEL_EXCISE_TAX"],
+    }
+)
+_CUSTOMS_CATS = frozenset({TAX_CATEGORIES["IMPORT_DUTY"], TAX_CATEGORIES["EXPORT_DUTY"]})
+
+# Category code -> TaxBreakdown field it is summed into
+_BUCKETS = ("vat", "excise", "customs", "other")
+_CAT_TO_FIELD: Dict[str, str] = {
+    **dict.fromkeys(_VAT_CATS, "vat"),
+    **dict.fromkeys(_EXCISE_CATS, "excise"),
+    **dict.fromkeys(_CUSTOMS_CATS, "customs"),
+}
+
+
+@lru_cache(maxsize=256, typed=True)
+def _rate_decimal(rate: Union[Decimal, float, int, str]) -> Decimal:
+    """Decimal form of a tax rate; rates come from a handful of values."""
+    return to_decimal(rate)
+
+
+def _percent_of(base: Decimal, rate: Union[Decimal, float, int, str]) -> Decimal:
+    """``base * rate / 100`` rounded half-up to the cent."""
+    return _CTX.quantize(base * _rate_decimal(rate) / HUNDRED, CENT)
 
 
 class TaxCalculation(BaseModel):
-    """Tax calculation result model."""
+    """Tax calculation result model.
+
+    TaxManager builds these with ``model_construct`` from values it has
+    already converted (Decimal amounts, float rates), skipping validation.
+    """
 
     category: str
     rate: float
@@ -20,7 +69,11 @@ class TaxCalculation(BaseModel):
 
 
 class TaxBreakdown(BaseModel):
-    """Comprehensive tax breakdown model."""
+    """Comprehensive tax breakdown model.
+
+    Built once per calculation by ``_summarize`` via ``model_construct``;
+    bucket totals are summed in local Decimals, never by field assignment.
+    """
 
     vat: Decimal
     excise: Decimal
@@ -30,6 +83,26 @@ class TaxBreakdown(BaseModel):
     details: List[TaxCalculation]
 
 
+def _summarize(details: List[TaxCalculation]) -> TaxBreakdown:
+    """Bucket calculations by category and build the breakdown in one go."""
+    # Decimal is immutable, so every bucket can start from the shared ZERO
+    totals = dict.fromkeys(_BUCKETS, ZERO)
+    total = ZERO
+    for calc in details:
+        bucket = _CAT_TO_FIELD.get(calc.category, "other")
+        totals[bucket] += calc.tax_amount
+        total += calc.tax_amount
+    # Every value is a Decimal computed here; skip re-validating the details
+    return TaxBreakdown.model_construct(
+        vat=totals["vat"],
+        excise=totals["excise"],
+        customs=totals["customs"],
+        other=totals["other"],
+        total=total,
+        details=details,
+    )
+
+
 class TaxManager:
     """Tax calculation and management utilities."""
 
@@ -44,15 +117,15 @@ class TaxManager:
         custom_rate: float | None = None,
     ) -> TaxCalculation:
         """Calculate tax for a line item."""
-        base_amount = Decimal(str(amount))
+        base_amount = to_decimal(amount)
 
         # Check for HSN-based exemption
         if hsn_code and HSNManager.is_exempt(hsn_code):
-            calculation = TaxCalculation(
-                category=TAX_CATEGORIES["STANDARD_VAT"],
-                rate=0,
+            calculation = TaxCalculation.model_construct(
+                category=_STD_VAT,
+                rate=0.0,
                 base_amount=base_amount,
-                tax_amount=Decimal("0"),
+                tax_amount=ZERO,
             )
             reason = HSNManager.get_exemption_reason(hsn_code)
             if reason:
@@ -67,13 +140,11 @@ class TaxManager:
         else:
             rate = cls.VAT_RATE
 
-        tax_amount = (
-            base_amount * Decimal(str(rate)) / Decimal("100")
-        ).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        tax_amount = _percent_of(base_amount, rate)
 
-        return TaxCalculation(
-            category=TAX_CATEGORIES["STANDARD_VAT"],
-            rate=rate,
+        return TaxCalculation.model_construct(
+            category=_STD_VAT,
+            rate=float(rate),
             base_amount=base_amount,
             tax_amount=tax_amount,
         )
@@ -83,123 +154,61 @@ class TaxManager:
         cls, amount: float, taxes: List[Dict[str, Any]]
     ) -> TaxBreakdown:
         """Calculate multiple taxes for an amount."""
-        base_amount = Decimal(str(amount))
-        breakdown = TaxBreakdown(
-            vat=Decimal("0"),
-            excise=Decimal("0"),
-            customs=Decimal("0"),
-            other=Decimal("0"),
-            total=Decimal("0"),
-            details=[],
-        )
+        base_amount = to_decimal(amount)
+        details: List[TaxCalculation] = []
 
-        for tax in taxes:
-            tax_amount = (
-                base_amount * Decimal(str(tax["rate"])) / Decimal("100")
-            ).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        # Every tax shares base_amount, so each distinct rate is computed once
+        amount_by_rate: Dict[Any, Decimal] = {}
 
-            calculation = TaxCalculation(
-                category=tax["category"],
-                rate=tax["rate"],
-                base_amount=base_amount,
-                tax_amount=tax_amount,
+        for tax in taxes:
+            rate = tax["rate"]
+            tax_amount = amount_by_rate.get(rate)
+            if tax_amount is None:
+                tax_amount = amount_by_rate[rate] = _percent_of(base_amount, rate)
+
+            details.append(
+                TaxCalculation.model_construct(
+                    category=tax["category"],
+                    rate=float(rate),
+                    base_amount=base_amount,
+                    tax_amount=tax_amount,
+                )
             )
 
-            breakdown.details.append(calculation)
-
-            # Categorize tax
-            category = tax["category"]
-            if category in [
-                TAX_CATEGORIES["STANDARD_VAT"],
-                TAX_CATEGORIES["REDUCED_VAT"],
-                TAX_CATEGORIES["ZERO_VAT"],
-            ]:
-                breakdown.vat += tax_amount
-            elif category in [
-                TAX_CATEGORIES["ALCOHOL_EXCISE_TAX"],
-                TAX_CATEGORIES["TOBACCO_EXCISE_TAX"],
-                TAX_CATEGORIES["FUEL_EXCISE_TAX"],
-            ]:
-                breakdown.excise += tax_amount
-            elif category in [
-                TAX_CATEGORIES["IMPORT_DUTY"],
-                TAX_CATEGORIES["EXPORT_DUTY"],
-            ]:
-                breakdown.customs += tax_amount
-            else:
-                breakdown.other += tax_amount
-
-            breakdown.total += tax_amount
-
-        return breakdown
+        return _summarize(details)
 
     @classmethod
     def calculate_cascading_tax(
         cls, amount: float, taxes: List[Dict[str, Any]]
     ) -> TaxBreakdown:
         """Calculate tax with cascading effect."""
-        current_amount = Decimal(str(amount))
-        breakdown = TaxBreakdown(
-            vat=Decimal("0"),
-            excise=Decimal("0"),
-            customs=Decimal("0"),
-            other=Decimal("0"),
-            total=Decimal("0"),
-            details=[],
-        )
+        current_amount = to_decimal(amount)
+        details: List[TaxCalculation] = []
 
         for tax in taxes:
-            tax_amount = (
-                current_amount * Decimal(str(tax["rate"])) / Decimal("100")
-            ).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-
-            calculation = TaxCalculation(
-                category=tax["category"],
-                rate=tax["rate"],
-                base_amount=current_amount,
-                tax_amount=tax_amount,
+            tax_amount = _percent_of(current_amount, tax["rate"])
+
+            details.append(
+                TaxCalculation.model_construct(
+                    category=tax["category"],
+                    rate=float(tax["rate"]),
+                    base_amount=current_amount,
+                    tax_amount=tax_amount,
+                )
             )
-
-            breakdown.details.append(calculation)
             # Add tax to base for next calculation
             current_amount += tax_amount
 
-            # Categorize tax
-            category = tax["category"]
-            if category in [
-                TAX_CATEGORIES["STANDARD_VAT"],
-                TAX_CATEGORIES["REDUCED_VAT"],
-                TAX_CATEGORIES["ZERO_VAT"],
-            ]:
-                breakdown.vat += tax_amount
-            elif category in [
-                TAX_CATEGORIES["ALCOHOL_EXCISE_TAX"],
-                TAX_CATEGORIES["TOBACCO_EXCISE_TAX"],
-                TAX_CATEGORIES["FUEL_EXCISE_TAX"],
-            ]:
-                breakdown.excise += tax_amount
-            elif category in [
-                TAX_CATEGORIES["IMPORT_DUTY"],
-                TAX_CATEGORIES["EXPORT_DUTY"],
-            ]:
-                breakdown.customs += tax_amount
-            else:
-                breakdown.other += tax_amount
-
-            breakdown.total += tax_amount
-
-        return breakdown
+        return _summarize(details)
 
     @classmethod
     def calculate_reverse_tax(
         cls, total_amount: float, tax_rate: float
     ) -> Dict[str, Decimal]:
         """Calculate reverse tax (tax inclusive price)."""
-        total = Decimal(str(total_amount))
-        divisor = (Decimal("100") + Decimal(str(tax_rate))) / Decimal("100")
-        base_amount = (total / divisor).quantize(
-            Decimal("0.01"), rounding=ROUND_HALF_UP
-        )
+        total = to_decimal(total_amount)
+        divisor = (HUNDRED + _rate_decimal(tax_rate)) / HUNDRED
+        base_amount = _CTX.quantize(total / divisor, CENT)
         tax_amount = total - base_amount
 
         return {"base_amount": base_amount, "tax_amount": tax_amount}
@@ -209,15 +218,13 @@ class TaxManager:
         cls, base_amount: float, tax_amount: float, rate: float
     ) -> bool:
         """Validate tax calculations."""
-        base = Decimal(str(base_amount))
-        tax = Decimal(str(tax_amount))
-        expected_tax = (
-            base * Decimal(str(rate)) / Decimal("100")
-        ).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        base = to_decimal(base_amount)
+        tax = to_decimal(tax_amount)
+        expected_tax = _percent_of(base, rate)
 
         # Allow for small rounding differences (0.01)
         difference = abs(tax - expected_tax)
-        return difference <= Decimal("0.01")
+        return difference <= CENT
 
     @classmethod
     def tax_to_calculation(
@@ -246,41 +253,34 @@ class TaxManager:
         cls, amount: float, rate: float = 10
     ) -> Decimal:
         """Calculate withholding tax."""
-        base_amount = Decimal(str(amount))
-        return (
-            base_amount * Decimal(str(rate)) / Decimal("100")
-        ).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        base_amount = to_decimal(amount)
+        return _percent_of(base_amount, rate)
 
     @classmethod
     def format_tax_amount(cls, amount: float, currency: str = "NGN") -> str:
         """Format tax amount for display."""
-        value = Decimal(str(amount))
-        return f"{currency} {value.quantize(Decimal('0.01'))}"
+        value = to_decimal(amount)
+        return f"{currency} {value.quantize(CENT)}"
 
     @classmethod
     def get_tax_summary(
         cls, calculations: List[TaxCalculation]
     ) -> Dict[str, Any]:
         """Get tax summary from multiple calculations."""
-        total_base = sum(
-            (calc.base_amount for calc in calculations), Decimal("0")
-        )
-        total_tax = sum(
-            (calc.tax_amount for calc in calculations), Decimal("0")
-        )
-
+        # One pass for both totals and the per-category breakdown
+        total_base = total_tax = ZERO
         categories: Dict[str, Decimal] = {}
         for calc in calculations:
-            if calc.category not in categories:
-                categories[calc.category] = Decimal("0")
-            categories[calc.category] += calc.tax_amount
+            total_base += calc.base_amount
+            total_tax += calc.tax_amount
+            categories[calc.category] = (
+                categories.get(calc.category, ZERO) + calc.tax_amount
+            )
 
         effective_rate = 0.0
         if total_base > 0:
             effective_rate = float(
-                (total_tax / total_base * Decimal("100")).quantize(
-                    Decimal("0.01"), rounding=ROUND_HALF_UP
-                )
+                _CTX.quantize(total_tax / total_base * HUNDRED, CENT)
             )
 
         return {
@@ -299,15 +299,13 @@ class TaxManager:
         is_holiday_applicable: bool,
     ) -> TaxCalculation:
         """Apply tax holidays or special rates."""
-        base_amount = Decimal(str(amount))
+        base_amount = to_decimal(amount)
         rate = holiday_rate if is_holiday_applicable else standard_rate
-        tax_amount = (
-            base_amount * Decimal(str(rate)) / Decimal("100")
-        ).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        tax_amount = _percent_of(base_amount, rate)
 
-        calculation = TaxCalculation(
-            category=TAX_CATEGORIES["STANDARD_VAT"],
-            rate=rate,
+        calculation = TaxCalculation.model_construct(
+            category=_STD_VAT,
+            rate=float(rate),
             base_amount=base_amount,
             tax_amount=tax_amount,
         )
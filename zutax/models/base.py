@@ -1,7 +1,10 @@
 """Base Pydantic model configuration for Zutax (formerly FIRS E-Invoice)."""
 
+import types
+from functools import cache
+from typing import Any, Dict, Self, Tuple, Union, get_args, get_origin
+
 from pydantic import BaseModel, ConfigDict
-from typing import Any, Dict
 
 
 class FIRSBaseModel(BaseModel):
@@ -20,39 +23,80 @@ class FIRSBaseModel(BaseModel):
     )
 
     def model_dump_json(self, **kwargs) -> str:
+        # Serialize in one pass through pydantic-core; enums are already
+        # plain values (use_enum_values) and Decimals encode as strings
         kwargs.setdefault("by_alias", True)
         kwargs.setdefault("exclude_none", True)
-        data = self.model_dump(by_alias=True, exclude_none=True)
-        import json
-        return json.dumps(data, indent=kwargs.get("indent", 2), default=str)
+        kwargs.setdefault("indent", 2)
+        return super().model_dump_json(**kwargs)
 
     def model_dump(self, **kwargs) -> Dict[str, Any]:
+        # use_enum_values stores enum fields as their values, so the dump
+        # needs no post-processing
         kwargs.setdefault("by_alias", True)
         kwargs.setdefault("exclude_none", True)
-        data = super().model_dump(**kwargs)
-        return self._convert_enums_to_values(data)
-
-    def _convert_enums_to_values(self, obj):
-        from enum import Enum
-        if isinstance(obj, dict):
-            return {
-                k: self._convert_enums_to_values(v)
-                for k, v in obj.items()
-            }
-        if isinstance(obj, list):
-            return [self._convert_enums_to_values(item) for item in obj]
-        if isinstance(obj, Enum):
-            return obj.value
-        return obj
+        return super().model_dump(**kwargs)
+
+    @classmethod
+    def from_trusted_dict(cls, data: Dict[str, Any]) -> Self:
+        """Rebuild a model tree from already-validated data, skipping validation.
+
+        ``data`` must be the Python-mode ``model_dump()`` of a model that was
+        validated when it was stored (dates, Decimals and enum values as the
+        SDK produces them). Nested SDK models are built the same way. Use
+        ``model_validate`` for anything that came from outside the SDK.
+        """
+        values = dict(data)
+        for name, (model, is_list) in _nested_models(cls).items():
+            value = values.get(name)
+            if value is None:
+                continue
+            if is_list:
+                values[name] = [
+                    item if isinstance(item, model) else model.from_trusted_dict(item)
+                    for item in value
+                ]
+            elif not isinstance(value, model):
+                values[name] = model.from_trusted_dict(value)
+        return cls.model_construct(**values)
+
+
+@cache
+def _nested_models(
+    cls: type[FIRSBaseModel],
+) -> Dict[str, Tuple[type[FIRSBaseModel], bool]]:
+    """Map each field of ``cls`` holding SDK models to (model, is_list)."""
+    nested: Dict[str, Tuple[type[FIRSBaseModel], bool]] = {}
+    for name, field in cls.model_fields.items():
+        annotation = field.annotation
+        if get_origin(annotation) in (Union, types.UnionType):
+            args = [arg for arg in get_args(annotation) if arg is not type(None)]
+            if len(args) != 1:
+                continue
+            annotation = args[0]
+        is_list = get_origin(annotation) is list
+        if is_list:
+            annotation = get_args(annotation)[0]
+        if isinstance(annotation, type) and issubclass(annotation, FIRSBaseModel):
+            nested[name] = (annotation, is_list)
+    return nested
 
 
 class StrictBaseModel(FIRSBaseModel):
     """Strict base model with additional validation constraints."""
 
-    _parent_config = FIRSBaseModel.model_config.copy()
-    _parent_config.update({
-        "extra": "forbid",
-        "str_min_length": 1,
-    })
+    model_config = ConfigDict(
+        **{**FIRSBaseModel.model_config, "extra": "forbid", "str_min_length": 1}
+    )
+
+
+class ComputeBaseModel(FIRSBaseModel):
+    """Base model for calculation results.
 
-    model_config = ConfigDict(**_parent_config)
+    Fields are validated on construction only; attribute writes are not
+    re-validated, so results can be adjusted or accumulated in place.
+    """
+
+    model_config = ConfigDict(
+        **{**FIRSBaseModel.model_config, "validate_assignment": False}
+    )
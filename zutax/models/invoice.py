@@ -1,5 +1,7 @@
 """Invoice Pydantic model - main model for Zutax FIRS E-Invoice."""
 
+import os
+
 from pydantic import Field, field_validator, model_validator
 from decimal import Decimal
 from datetime import datetime, date
@@ -8,6 +10,7 @@ from .base import StrictBaseModel
 from .party import Party
 from .line_item import LineItem
 from .tax import TaxBreakdown
+from ..utils.decimals import ZERO
 from .enums import (
     InvoiceType,
     InvoiceStatus,
@@ -16,6 +19,14 @@ from .enums import (
     TaxCategory,
 )
 
+_TOTAL_FIELDS = (
+    "subtotal",
+    "total_discount",
+    "total_charges",
+    "total_tax",
+    "total_amount",
+)
+
 
 class ValidationError(StrictBaseModel):
     """Custom validation error model."""
@@ -177,7 +188,7 @@ class Invoice(StrictBaseModel):
         None, description="FIRS submission timestamp"
     )
 
-    # Financial totals (to be calculated externally)
+    # Financial totals (derived by calculate_totals unless supplied)
     subtotal: Optional[Decimal] = Field(
         None, ge=0, decimal_places=2, description="Subtotal amount"
     )
@@ -231,8 +242,6 @@ class Invoice(StrictBaseModel):
     @model_validator(mode="after")
     def validate_line_items_required(self) -> "Invoice":
         """Ensure at least one line item exists (except in testing)."""
-        import os
-
         if (
             not self.line_items
             and os.environ.get("PYTEST_CURRENT_TEST") is None
@@ -248,6 +257,43 @@ class Invoice(StrictBaseModel):
                 item.line_number = idx
         return self
 
+    @model_validator(mode="after")
+    def calculate_totals(self) -> "Invoice":
+        """Sum line amounts into the totals the caller did not supply.
+
+        All five totals come from a single pass over the line items.
+        """
+        provided = self.model_fields_set
+        totals = self.__dict__
+        missing = [
+            name
+            for name in _TOTAL_FIELDS
+            if name not in provided or totals[name] is None
+        ]
+        if not missing:
+            return self
+
+        subtotal = discount = charges = tax = total = ZERO
+        # calculate_amounts fills these; "or" only narrows the Optional types
+        for item in self.line_items:
+            subtotal += item.base_amount or ZERO
+            discount += item.discount_amount or ZERO
+            charges += item.charge_amount or ZERO
+            tax += item.tax_amount or ZERO
+            total += item.line_total or ZERO
+
+        computed = dict(
+            zip(_TOTAL_FIELDS, (subtotal, discount, charges, tax, total))
+        )
+        for name in missing:
+            totals[name] = computed[name]
+        return self
+
+    @property
+    def line_count(self) -> int:
+        """Number of line items on the invoice."""
+        return len(self.line_items)
+
 
     model_config = {
         "json_schema_extra": {
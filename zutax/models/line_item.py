@@ -1,10 +1,16 @@
 """Line item Pydantic models for invoice items (Zutax)."""
 
-from pydantic import Field, field_validator
-from decimal import Decimal
+from pydantic import Field, field_validator, model_validator
+from decimal import Decimal, ROUND_HALF_UP
 from typing import Optional, List
 from .base import FIRSBaseModel, StrictBaseModel
 from .enums import UnitOfMeasure, TaxCategory
+from ..utils.decimals import ZERO, HUNDRED, CENT, to_decimal
+
+
+def _cents(value: Decimal) -> Decimal:
+    """Round an amount half-up to the cent."""
+    return value.quantize(CENT, rounding=ROUND_HALF_UP)
 
 
 class Discount(FIRSBaseModel):
@@ -29,16 +35,14 @@ class Discount(FIRSBaseModel):
         description="Discount description",
     )
 
-    @field_validator("amount", "percent")
-    @classmethod
-    def validate_discount(cls, v, info):
+    @model_validator(mode="after")
+    def validate_discount(self) -> "Discount":
         """Ensure either amount or percent is provided, not both."""
-        values = info.data
-        if values.get("amount") and values.get("percent"):
+        if self.amount and self.percent:
             raise ValueError(
                 "Cannot specify both discount amount and percentage"
             )
-        return v
+        return self
 
 
 class Charge(FIRSBaseModel):
@@ -182,7 +186,7 @@ class LineItem(StrictBaseModel):
         description="Line item notes or comments",
     )
 
-    # Line amounts (to be calculated externally)
+    # Line amounts (derived by calculate_amounts unless supplied)
     base_amount: Optional[Decimal] = Field(
         None, ge=0, decimal_places=2, description="Base amount (quantity * unit_price)"
     )
@@ -202,16 +206,6 @@ class LineItem(StrictBaseModel):
         None, ge=0, decimal_places=2, description="Line total including tax"
     )
 
-    @field_validator("hsn_code")
-    @classmethod
-    def validate_hsn_code(cls, v: str) -> str:
-        """Validate HSN/SAC code format."""
-        if not v.isdigit():
-            raise ValueError("HSN code must contain only digits")
-        if len(v) < 4 or len(v) > 8:
-            raise ValueError("HSN code must be between 4 and 8 digits")
-        return v
-
     @field_validator("tax_exempt_reason")
     @classmethod
     def validate_tax_exempt_reason(
@@ -239,10 +233,66 @@ class LineItem(StrictBaseModel):
     @classmethod
     def coerce_to_decimal(cls, v):
         """Convert numeric values to Decimal."""
-        if isinstance(v, (int, float, str)):
-            return Decimal(str(v))
+        if isinstance(v, (float, int, str)) and not isinstance(v, bool):
+            return to_decimal(v)
         return v
 
+    @model_validator(mode="after")
+    def calculate_amounts(self) -> "LineItem":
+        """Derive the line amounts the caller did not supply, in one pass.
+
+        Derived amounts are rounded half-up to the cent, stored on the model
+        rather than recomputed on access, and refreshed when an input field
+        is re-assigned. A discount larger than the line amount is rejected.
+        """
+        provided = self.model_fields_set
+        amounts = self.__dict__
+
+        def missing(name: str) -> bool:
+            return name not in provided or amounts[name] is None
+
+        if missing("base_amount"):
+            amounts["base_amount"] = _cents(self.quantity * self.unit_price)
+        base = amounts["base_amount"]
+
+        if missing("discount_amount"):
+            discount = self.discount
+            percent = self.discount_percent
+            if percent is None and discount is not None:
+                percent = discount.percent
+            if percent is not None:
+                discount_amount = base * percent / HUNDRED
+            elif discount is not None and discount.amount is not None:
+                discount_amount = discount.amount
+            else:
+                discount_amount = ZERO
+            amounts["discount_amount"] = _cents(discount_amount)
+
+        if missing("charge_amount"):
+            charge_amount = ZERO
+            for charge in self.charges or ():
+                charge_amount += charge.amount
+            amounts["charge_amount"] = _cents(charge_amount)
+
+        if missing("taxable_amount"):
+            taxable_amount = (
+                base - amounts["discount_amount"] + amounts["charge_amount"]
+            )
+            if taxable_amount < 0:
+                raise ValueError("Discount cannot exceed the line amount")
+            amounts["taxable_amount"] = _cents(taxable_amount)
+        taxable = amounts["taxable_amount"]
+
+        if missing("tax_amount"):
+            if self.tax_exempt or self.tax_exemption_reason:
+                amounts["tax_amount"] = _cents(ZERO)
+            else:
+                amounts["tax_amount"] = _cents(taxable * self.tax_rate / HUNDRED)
+
+        if missing("line_total"):
+            amounts["line_total"] = _cents(taxable + amounts["tax_amount"])
+        return self
+
     model_config = {
         "json_schema_extra": {
             "example": {
@@ -6,6 +6,30 @@ import re
 from .base import FIRSBaseModel, StrictBaseModel
 from .enums import StateCode, CountryCode
 
+_NON_DIGIT = re.compile(r'\D')
+# Deletes every ASCII non-digit; one C-level pass for the common ASCII input
+_ASCII_NON_DIGITS = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if not chr(c).isdigit()
+))
+
+
+def _normalize_phone(v: str) -> str:
+    """Return a Nigerian phone number in +234XXXXXXXXXX form."""
+    if v.isascii():
+        phone = v.translate(_ASCII_NON_DIGITS)
+    else:
+        phone = _NON_DIGIT.sub('', v)
+    if phone.startswith('234'):
+        if len(phone) != 13:
+            raise ValueError('Invalid Nigerian phone number format')
+        return f'+{phone}'
+    elif phone.startswith('0'):
+        if len(phone) != 11:
+            raise ValueError('Invalid Nigerian phone number format')
+        return f'+234{phone[1:]}'
+    else:
+        raise ValueError('Phone number must start with 0 or 234')
+
 
 class Address(StrictBaseModel):
     street: str = Field(..., min_length=1, max_length=200, description="Street address")
@@ -16,13 +40,6 @@ class Address(StrictBaseModel):
     postal_code: Optional[str] = Field(None, pattern=r'^\d{6}$', description="Postal code")
     country_code: CountryCode = Field(default=CountryCode.NG, description="Country code")
 
-    @field_validator('postal_code')
-    @classmethod
-    def validate_postal_code(cls, v: Optional[str]) -> Optional[str]:
-        if v and not re.match(r'^\d{6}$', v):
-            raise ValueError('Postal code must be 6 digits')
-        return v
-
 
 class Contact(FIRSBaseModel):
     name: str = Field(..., min_length=1, max_length=100, description="Contact person name")
@@ -33,17 +50,7 @@ class Contact(FIRSBaseModel):
     @field_validator('phone')
     @classmethod
     def validate_phone(cls, v: str) -> str:
-        phone = re.sub(r'\D', '', v)
-        if phone.startswith('234'):
-            if len(phone) != 13:
-                raise ValueError('Invalid Nigerian phone number format')
-            return f'+{phone}'
-        elif phone.startswith('0'):
-            if len(phone) != 11:
-                raise ValueError('Invalid Nigerian phone number format')
-            return f'+234{phone[1:]}'
-        else:
-            raise ValueError('Phone number must start with 0 or 234')
+        return _normalize_phone(v)
 
 
 class Party(StrictBaseModel):
@@ -67,29 +74,10 @@ class Party(StrictBaseModel):
     contacts: Optional[List[Contact]] = Field(None, max_length=10, description="Contacts")
     industry_code: Optional[str] = Field(None, pattern=r'^\d{4,6}$', description="Industry code")
 
-    @field_validator('tin')
-    @classmethod
-    def validate_tin(cls, v: str) -> str:
-        if not v.isdigit():
-            raise ValueError('TIN must contain only digits')
-        if len(v) < 8 or len(v) > 15:
-            raise ValueError('TIN must be between 8 and 15 digits')
-        return v
-
     @field_validator('phone')
     @classmethod
     def normalize_phone(cls, v: str) -> str:
-        phone = re.sub(r'\D', '', v)
-        if phone.startswith('234'):
-            if len(phone) != 13:
-                raise ValueError('Invalid Nigerian phone number format')
-            return f'+{phone}'
-        elif phone.startswith('0'):
-            if len(phone) != 11:
-                raise ValueError('Invalid Nigerian phone number format')
-            return f'+234{phone[1:]}'
-        else:
-            raise ValueError('Phone number must start with 0 or 234')
+        return _normalize_phone(v)
 
     @field_validator('vat_number')
     @classmethod
@@ -3,8 +3,9 @@
 from pydantic import Field, computed_field
 from decimal import Decimal
 from typing import Optional, List, Dict
-from .base import FIRSBaseModel
+from .base import ComputeBaseModel, FIRSBaseModel
 from .enums import TaxCategory
+from ..utils.decimals import ZERO, HUNDRED
 
 
 class Tax(FIRSBaseModel):
@@ -50,11 +51,11 @@ class TaxDetail(FIRSBaseModel):
     def effective_rate(self) -> Decimal:
         """Calculate effective tax rate."""
         if self.taxable_amount == 0:
-            return Decimal("0")
-        return (self.tax_amount / self.taxable_amount) * Decimal("100")
+            return ZERO
+        return (self.tax_amount / self.taxable_amount) * HUNDRED
 
 
-class TaxBreakdown(FIRSBaseModel):
+class TaxBreakdown(ComputeBaseModel):
     """Complete tax breakdown for an invoice."""
 
     subtotal: Decimal = Field(
@@ -83,17 +84,15 @@ class TaxBreakdown(FIRSBaseModel):
     @property
     def total_tax(self) -> Decimal:
         """Calculate total tax amount."""
-        return sum(detail.tax_amount for detail in self.tax_details)
+        return sum([detail.tax_amount for detail in self.tax_details], ZERO)
 
     @computed_field
     @property
     def total_exempt(self) -> Decimal:
         """Calculate total exempt amount."""
         return sum(
-            (
-                detail.exempt_amount or Decimal("0")
-                for detail in self.tax_details
-            )
+            [detail.exempt_amount or ZERO for detail in self.tax_details],
+            ZERO,
         )
 
     @computed_field
@@ -113,13 +112,11 @@ class TaxBreakdown(FIRSBaseModel):
                 if isinstance(detail.category, str)
                 else detail.category.value
             )
-            if category not in summary:
-                summary[category] = Decimal("0")
-            summary[category] += detail.tax_amount
+            summary[category] = summary.get(category, ZERO) + detail.tax_amount
         return summary
 
 
-class TaxCalculation(FIRSBaseModel):
+class TaxCalculation(ComputeBaseModel):
     """Tax calculation result model."""
 
     base_amount: Decimal = Field(
@@ -184,8 +181,8 @@ class TaxCalculation(FIRSBaseModel):
     def effective_tax_rate(self) -> Decimal:
         """Calculate effective tax rate."""
         if self.taxable_amount == 0:
-            return Decimal("0")
-        return (self.tax_amount / self.taxable_amount) * Decimal("100")
+            return ZERO
+        return (self.tax_amount / self.taxable_amount) * HUNDRED
 
     model_config = {
         "json_schema_extra": {
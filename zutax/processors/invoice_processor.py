@@ -9,7 +9,6 @@ from ..models.invoice import Invoice, ValidationError
 from ..builders.invoice_builder import InvoiceBuilder
 from ..schemas.validators_impl import InvoiceValidator
 from ..crypto.irn import IRNGenerator  # type: ignore
-from ..crypto.firs_qrcode import FIRSQRCodeGenerator  # type: ignore
 from ..config.settings import BusinessContext
 
 
@@ -80,6 +79,9 @@ class InvoiceProcessor:
             irn = irn_generator.generate_irn(invoice)
             invoice.irn = irn
 
+            # qrcode/Pillow load on first QR, not at SDK import
+            from ..crypto.firs_qrcode import FIRSQRCodeGenerator  # noqa: WPS433
+
             qr_generator = FIRSQRCodeGenerator(config=config)
             qr_code = qr_generator.generate_qr_code(irn)
             invoice.qr_code = qr_code
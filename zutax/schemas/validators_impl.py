@@ -5,6 +5,8 @@ from typing import Optional, Tuple
 from decimal import Decimal
 from ..config.constants import VALIDATION_RULES, VAT_EXEMPT_HSN_CODES
 
+_VAT_EXEMPT_HSN = frozenset(VAT_EXEMPT_HSN_CODES)
+
 # Re-exported function names preserved to avoid breaking imports
 
 
@@ -123,15 +125,12 @@ def validate_tax_rate(tax_rate: Decimal) -> Tuple[bool, Optional[str]]:
 def is_vat_exempt(hsn_code: str) -> bool:
     if not hsn_code:
         return False
-    if hsn_code in VAT_EXEMPT_HSN_CODES:
-        return True
-    hsn_prefix_2 = hsn_code[:2] if len(hsn_code) >= 2 else None
-    hsn_prefix_4 = hsn_code[:4] if len(hsn_code) >= 4 else None
-    if hsn_prefix_2 and hsn_prefix_2 in VAT_EXEMPT_HSN_CODES:
-        return True
-    if hsn_prefix_4 and hsn_prefix_4 in VAT_EXEMPT_HSN_CODES:
-        return True
-    return False
+    # Exact code, or its 2- or 4-digit chapter/heading prefix
+    return (
+        hsn_code in _VAT_EXEMPT_HSN
+        or hsn_code[:2] in _VAT_EXEMPT_HSN
+        or hsn_code[:4] in _VAT_EXEMPT_HSN
+    )
 
 
 def validate_currency_code(currency: str) -> Tuple[bool, Optional[str]]:
@@ -237,11 +236,12 @@ class InvoiceValidator:
         warnings (List[str]).
         """
         try:
-            # Basic validation - ensure it's a valid Pydantic model instance
-            if hasattr(invoice, "model_validate") and hasattr(
-                invoice, "model_dump"
-            ):
-                invoice.model_validate(invoice.model_dump())
+            # Re-run the model's field/model validators directly on the
+            # instance's field values; nested models are already validated
+            # (validate_assignment) so no dump + parse round-trip is needed.
+            validator = getattr(type(invoice), "__pydantic_validator__", None)
+            if validator is not None:
+                validator.validate_python(dict(invoice.__dict__))
 
             return {"valid": True, "errors": [], "warnings": []}
         except Exception as e:  # pragma: no cover - defensive
@@ -5,6 +5,7 @@ from .formatting import (  # noqa: F401
     format_percentage,
     calculate_percentage,
     round_decimal,
+    safe_filename,
 )
 
 __all__ = [
@@ -12,4 +13,5 @@ __all__ = [
     "format_percentage",
     "calculate_percentage",
     "round_decimal",
+    "safe_filename",
 ]
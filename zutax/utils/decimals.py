@@ -0,0 +1,20 @@
+"""Shared Decimal constants and conversion for Zutax SDK (native)."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Union
+
+ZERO = Decimal(0)
+HUNDRED = Decimal(100)
+CENT = Decimal("0.01")
+
+
+def to_decimal(value: Union[Decimal, float, int, str]) -> Decimal:
+    """Convert to Decimal, going through str() only for floats."""
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, float):
+        # str() keeps the short repr (0.1 -> "0.1"), not the binary expansion
+        return Decimal(str(value))
+    return Decimal(value)
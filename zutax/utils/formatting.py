@@ -10,6 +10,7 @@ from decimal import Decimal, ROUND_HALF_UP
 from typing import Dict
 
 from ..models.enums import Currency
+from .decimals import HUNDRED, CENT
 
 
 def format_currency(amount: Decimal, currency: Currency = Currency.NGN) -> str:
@@ -43,19 +44,28 @@ def format_percentage(percentage: Decimal) -> str:
 
 def calculate_percentage(amount: Decimal, percentage: Decimal) -> Decimal:
     """Calculate the percentage of an amount and round to 2 decimals."""
-    result = (amount * percentage) / Decimal("100")
+    result = (amount * percentage) / HUNDRED
     return round_decimal(result)
 
 
 def round_decimal(value: Decimal, places: int = 2) -> Decimal:
     """Round a Decimal to the specified number of places using HALF_UP."""
-    quantizer = Decimal("0.1") ** places
+    quantizer = CENT if places == 2 else Decimal(1).scaleb(-places)
     return value.quantize(quantizer, rounding=ROUND_HALF_UP)
 
 
+_FILENAME_TABLE = str.maketrans({"/": "_", "\\": "_", ":": "_"})
+
+
+def safe_filename(name: str) -> str:
+    """Replace path separators and ':' so ``name`` is a single file name."""
+    return name.translate(_FILENAME_TABLE)
+
+
 __all__ = [
     "format_currency",
     "format_percentage",
     "calculate_percentage",
     "round_decimal",
+    "safe_filename",
 ]
@@ -0,0 +1,71 @@
+"""JSON serialization helpers for Zutax SDK (native).
+
+Uses ``orjson`` when it is installed (``pip install zutax[fast]``) and
+falls back to the standard library otherwise. Both paths produce the same
+document shape: UTF-8 text, ISO 8601 dates, Decimals as strings and
+Pydantic models as their JSON-mode dumps.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any
+
+try:  # pragma: no cover - exercised only when orjson is installed
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+def _default(obj: Any) -> Any:
+    """Encode values the JSON encoders do not handle natively."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if hasattr(obj, "model_dump"):  # Pydantic models
+        return obj.model_dump(mode="json")
+    return str(obj)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes.
+
+    Args:
+        obj: Object to serialize (dicts, lists, primitives, Decimal, dates)
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        Encoded JSON document.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, default=_default, option=option)
+    return json.dumps(
+        obj,
+        default=_default,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+    ).encode("utf-8")
+
+
+def dumps_str(obj: Any, indent: bool = False) -> str:
+    """Serialize ``obj`` to a JSON string (see :func:`dumps`)."""
+    return dumps(obj, indent=indent).decode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document from bytes or text.
+
+    Raises:
+        ValueError: If ``data`` is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+__all__ = ["dumps", "dumps_str", "loads"]